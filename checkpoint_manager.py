@@ -1,48 +1,71 @@
-import json
 import os
 import time
+import asyncio
 import logging
-from typing import Dict, Any, Set, List
-from dataclasses import dataclass, asdict
-from config import config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Set, List, Iterable, Optional
+from dataclasses import dataclass, field, fields
+import orjson
+from config import config, CRAWLER_SEQUENCE
+from utils import ensure_dir
 
-@dataclass
+@dataclass(slots=True)
 class CrawlerCheckpoint:
     """Checkpoint data for a specific crawler"""
     crawler_name: str
     completed: bool = False
     total_items: int = 0
     processed_items: int = 0
-    failed_items: List[str] = None
-    skipped_items: List[str] = None
-    last_update: float = 0
-    
-    def __post_init__(self):
-        if self.failed_items is None:
-            self.failed_items = []
-        if self.skipped_items is None:
-            self.skipped_items = []
-        if self.last_update == 0:
-            self.last_update = time.time()
+    failed_items: Set[str] = field(default_factory=set)
+    skipped_items: Set[str] = field(default_factory=set)
+    last_update: float = field(default_factory=time.time)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CrawlerCheckpoint':
+        """Decode a crawler checkpoint from its JSON form"""
+        crawler = cls(**{k: v for k, v in data.items() if k in _CRAWLER_FIELDS})
+        crawler.failed_items = set(crawler.failed_items or ())
+        crawler.skipped_items = set(crawler.skipped_items or ())
+        return crawler
 
-@dataclass  
+@dataclass(slots=True)
 class MasterCheckpoint:
     """Master checkpoint containing all crawler states"""
     repo_owner: str
     repo_name: str
     start_time: float
     last_update: float
-    crawlers: Dict[str, CrawlerCheckpoint] = None
-    completed_pull_numbers: Set[int] = None
-    completed_commit_shas: Set[str] = None
-    
-    def __post_init__(self):
-        if self.crawlers is None:
-            self.crawlers = {}
-        if self.completed_pull_numbers is None:
-            self.completed_pull_numbers = set()
-        if self.completed_commit_shas is None:
-            self.completed_commit_shas = set()
+    crawlers: Dict[str, CrawlerCheckpoint] = field(default_factory=dict)
+    completed_pull_numbers: Set[int] = field(default_factory=set)
+    completed_commit_shas: Set[bytes] = field(default_factory=set)  # Packed via _pack_sha
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MasterCheckpoint':
+        """Decode a master checkpoint (without completed sets) from its JSON form"""
+        return cls(
+            repo_owner=data['repo_owner'],
+            repo_name=data['repo_name'],
+            start_time=data['start_time'],
+            last_update=data['last_update'],
+            crawlers={name: CrawlerCheckpoint.from_dict(crawler_data)
+                      for name, crawler_data in data.get('crawlers', {}).items()}
+        )
+
+# Field names resolved once so decoding never introspects the dataclass per load
+_CRAWLER_FIELDS = frozenset(f.name for f in fields(CrawlerCheckpoint))
+
+# Durable writes complete only once data hits disk, avoiding a separate fsync (0 where unsupported)
+_O_DSYNC = getattr(os, 'O_DSYNC', 0)
+
+# Bytes read from the end of the completed log when looking for a torn final line
+_LOG_TAIL_SCAN = 4096
+
+def _pack_sha(commit_sha: str) -> bytes:
+    """Pack a hex commit SHA into raw bytes (20 instead of 40+ bytes per SHA)"""
+    try:
+        return bytes.fromhex(commit_sha)
+    except ValueError:
+        return commit_sha.encode()
 
 class CheckpointManager:
     """Manages crawling checkpoints for resume capability"""
@@ -51,125 +74,280 @@ class CheckpointManager:
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.checkpoint_file = self._get_checkpoint_path()
+        
+        # Completed pulls/commits only ever grow, so they live in an append-only
+        # sidecar log instead of being rewritten with every checkpoint save
+        self.completed_log_file = f"{os.path.dirname(self.checkpoint_file)}/.checkpoint.completed.log"
+        self._repair_completed_log()
+        self._log_fd = os.open(self.completed_log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        
+        # Directory handle used to make renames durable (not supported on Windows)
+        self._dir_fd = None
+        if os.name != 'nt':
+            self._dir_fd = os.open(os.path.dirname(self.checkpoint_file), os.O_RDONLY)
+        
         self.checkpoint: MasterCheckpoint = self._load_or_create_checkpoint()
         
+        # Coarse clock for per-item timestamps, refreshed by tick() and on save
+        self._now = time.time()
+        
+        # Save coalescing: skip writes when nothing changed or the last save was recent
+        self._dirty = False
+        self._last_save = 0.0
+        
+        # Dedicated writer so checkpoint saves are ordered and never queue
+        # behind data file writes on the default executor
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkpoint-writer')
+        
     def _get_checkpoint_path(self) -> str:
         """Get path to checkpoint file"""
         folder_name = f"{self.repo_owner}-{self.repo_name}"
         base_path = f"{config.base_folder}/{folder_name}"
-        os.makedirs(base_path, exist_ok=True)
+        ensure_dir(base_path)
         return f"{base_path}/.checkpoint.json"
     
     def _load_or_create_checkpoint(self) -> MasterCheckpoint:
         """Load existing checkpoint or create new one"""
+        checkpoint = None
+        legacy_pulls: Set[int] = set()
+        legacy_shas: Set[str] = set()
+        
         if os.path.exists(self.checkpoint_file):
             try:
-                with open(self.checkpoint_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Convert sets back from lists
-                data['completed_pull_numbers'] = set(data.get('completed_pull_numbers', []))
-                data['completed_commit_shas'] = set(data.get('completed_commit_shas', []))
+                with open(self.checkpoint_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                 
-                # Reconstruct crawler checkpoints
-                crawlers = {}
-                for name, crawler_data in data.get('crawlers', {}).items():
-                    crawlers[name] = CrawlerCheckpoint(**crawler_data)
-                data['crawlers'] = crawlers
+                # Older checkpoints stored the completed sets inline
+                legacy_pulls = set(data.pop('completed_pull_numbers', []))
+                legacy_shas = set(data.pop('completed_commit_shas', []))
                 
-                return MasterCheckpoint(**data)
+                checkpoint = MasterCheckpoint.from_dict(data)
                 
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
                 logging.warning(f"Failed to load checkpoint: {e}. Creating new one.")
         
-        # Create new checkpoint
-        return MasterCheckpoint(
-            repo_owner=self.repo_owner,
-            repo_name=self.repo_name,
-            start_time=time.time(),
-            last_update=time.time()
-        )
+        if checkpoint is None:
+            # Create new checkpoint
+            checkpoint = MasterCheckpoint(
+                repo_owner=self.repo_owner,
+                repo_name=self.repo_name,
+                start_time=time.time(),
+                last_update=time.time()
+            )
+        
+        self._replay_completed_log(checkpoint)
+        
+        # Migrate inline sets from older checkpoints into the log
+        self.add_completed_pull_numbers(legacy_pulls, checkpoint)
+        self.add_completed_commit_shas(legacy_shas, checkpoint)
+        
+        return checkpoint
     
-    def save_checkpoint(self):
-        """Save current checkpoint to file"""
+    def _repair_completed_log(self):
+        """Cut a torn final line (no trailing newline) so new appends start on a fresh line"""
+        try:
+            with open(self.completed_log_file, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                if not size:
+                    return
+                # Entries are short, so the last newline is within the final few KiB
+                tail_start = max(0, size - _LOG_TAIL_SCAN)
+                f.seek(tail_start)
+                tail = f.read()
+                if tail.endswith(b'\n'):
+                    return
+                
+                # A partial entry may be a prefix of another (P:123 torn to P:12), so drop it
+                keep = tail_start + tail.rfind(b'\n') + 1
+                f.truncate(keep)
+                logging.warning(f"Dropped torn entry at end of completed log ({size - keep} bytes)")
+        except FileNotFoundError:
+            pass
+    
+    def _replay_completed_log(self, checkpoint: MasterCheckpoint):
+        """Repopulate completed pulls/commits from the append-only log"""
+        try:
+            with open(self.completed_log_file, 'rb') as f:
+                for line in f:
+                    kind, _, value = line.rstrip(b'\n').partition(b':')
+                    try:
+                        if kind == b'P':
+                            checkpoint.completed_pull_numbers.add(int(value))
+                        elif kind == b'C' and value:
+                            checkpoint.completed_commit_shas.add(_pack_sha(value.decode()))
+                    except ValueError:
+                        logging.warning(f"Skipping malformed completed log entry: {line!r}")
+        except OSError as e:
+            logging.warning(f"Failed to replay completed log: {e}")
+    
+    def save_checkpoint(self, force: bool = False):
+        """Save current checkpoint to file
+        
+        Periodic saves are coalesced: unless force is set, nothing is written
+        when the checkpoint is clean or was saved less than
+        config.checkpoint_min_interval seconds ago. Only forced saves are
+        fsynced; a crash otherwise just replays the last checkpoint interval.
+        """
+        blob = self._serialize_if_due(force)
+        if blob is not None:
+            # Through the writer too, so it can't race an in-flight async save on the .tmp file
+            self._writer.submit(self._write_checkpoint, blob, force).result()
+    
+    async def save_checkpoint_async(self, force: bool = False):
+        """Save checkpoint without blocking the event loop on file I/O"""
+        # Serialize on the loop thread so the state is not mutated mid-encode
+        blob = self._serialize_if_due(force)
+        if blob is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._writer, self._write_checkpoint, blob, force)
+    
+    def _serialize_if_due(self, force: bool) -> Optional[bytes]:
+        """Encode the checkpoint if a save is due, marking it clean"""
+        now = self.tick()
+        if not force and (not self._dirty or now - self._last_save < config.checkpoint_min_interval):
+            return None
+        
+        try:
+            blob = orjson.dumps(self._to_serializable(now), option=orjson.OPT_NON_STR_KEYS)
+        except Exception as e:
+            logging.error(f"Failed to serialize checkpoint: {e}")
+            return None
+        
+        self._dirty = False
+        self._last_save = now
+        return blob
+    
+    def _to_serializable(self, now: float) -> Dict[str, Any]:
+        """Build the JSON form of the checkpoint without copying nested dataclasses"""
+        checkpoint = self.checkpoint
+        return {
+            'repo_owner': checkpoint.repo_owner,
+            'repo_name': checkpoint.repo_name,
+            'start_time': checkpoint.start_time,
+            'last_update': now,
+            'crawlers': {
+                name: {
+                    'crawler_name': crawler.crawler_name,
+                    'completed': crawler.completed,
+                    'total_items': crawler.total_items,
+                    'processed_items': crawler.processed_items,
+                    'failed_items': list(crawler.failed_items),
+                    'skipped_items': list(crawler.skipped_items),
+                    'last_update': crawler.last_update,
+                }
+                for name, crawler in checkpoint.crawlers.items()
+            },
+        }
+    
+    def _write_checkpoint(self, blob: bytes, durable: bool):
+        """Atomically replace the checkpoint file with the encoded blob"""
         try:
-            # Convert to serializable format
-            data = asdict(self.checkpoint)
-            
-            # Convert sets to lists for JSON serialization
-            data['completed_pull_numbers'] = list(self.checkpoint.completed_pull_numbers)
-            data['completed_commit_shas'] = list(self.checkpoint.completed_commit_shas)
-            
-            # Convert crawler checkpoints
-            data['crawlers'] = {
-                name: asdict(crawler) 
-                for name, crawler in self.checkpoint.crawlers.items()
-            }
-            
-            data['last_update'] = time.time()
-            
-            # Atomic write
             temp_file = f"{self.checkpoint_file}.tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            if durable:
+                flags |= _O_DSYNC
+            fd = os.open(temp_file, flags, 0o644)
+            try:
+                os.write(fd, blob)
+                if durable and not _O_DSYNC:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
             
-            os.rename(temp_file, self.checkpoint_file)
+            os.replace(temp_file, self.checkpoint_file)
+            if durable:
+                self._sync_log_and_dir()
             
         except Exception as e:
             logging.error(f"Failed to save checkpoint: {e}")
+            self._dirty = True
+    
+    def tick(self) -> float:
+        """Refresh the cached clock used for last_update timestamps"""
+        self._now = time.time()
+        return self._now
     
     def init_crawler(self, crawler_name: str, total_items: int) -> CrawlerCheckpoint:
         """Initialize or get existing crawler checkpoint"""
-        if crawler_name not in self.checkpoint.crawlers:
-            self.checkpoint.crawlers[crawler_name] = CrawlerCheckpoint(
-                crawler_name=crawler_name,
-                total_items=total_items
-            )
+        crawler = self.checkpoint.crawlers.get(crawler_name)
+        if crawler is None:
+            crawler = CrawlerCheckpoint(crawler_name=crawler_name, total_items=total_items)
+            self.checkpoint.crawlers[crawler_name] = crawler
         else:
             # Update total items if changed
-            self.checkpoint.crawlers[crawler_name].total_items = total_items
+            crawler.total_items = total_items
         
-        return self.checkpoint.crawlers[crawler_name]
+        self._dirty = True
+        return crawler
     
     def update_crawler_progress(self, crawler_name: str, processed: int = 0, 
                               failed_item: str = None, skipped_item: str = None):
         """Update crawler progress"""
-        if crawler_name not in self.checkpoint.crawlers:
-            self.checkpoint.crawlers[crawler_name] = CrawlerCheckpoint(crawler_name=crawler_name)
-        
-        crawler = self.checkpoint.crawlers[crawler_name]
+        crawler = self.checkpoint.crawlers.get(crawler_name)
+        if crawler is None:
+            crawler = CrawlerCheckpoint(crawler_name=crawler_name)
+            self.checkpoint.crawlers[crawler_name] = crawler
         
         if processed > 0:
             crawler.processed_items += processed
         
         if failed_item:
-            if failed_item not in crawler.failed_items:
-                crawler.failed_items.append(failed_item)
+            crawler.failed_items.add(failed_item)
         
         if skipped_item:
-            if skipped_item not in crawler.skipped_items:
-                crawler.skipped_items.append(skipped_item)
+            crawler.skipped_items.add(skipped_item)
         
-        crawler.last_update = time.time()
+        crawler.last_update = self._now
+        self._dirty = True
     
     def complete_crawler(self, crawler_name: str):
         """Mark crawler as completed"""
-        if crawler_name in self.checkpoint.crawlers:
-            self.checkpoint.crawlers[crawler_name].completed = True
-            self.checkpoint.crawlers[crawler_name].last_update = time.time()
+        crawler = self.checkpoint.crawlers.get(crawler_name)
+        if crawler is not None:
+            crawler.completed = True
+            crawler.last_update = self.tick()
+            self._dirty = True
     
     def is_crawler_completed(self, crawler_name: str) -> bool:
         """Check if crawler is already completed"""
-        return (crawler_name in self.checkpoint.crawlers and 
-                self.checkpoint.crawlers[crawler_name].completed)
+        crawler = self.checkpoint.crawlers.get(crawler_name)
+        return crawler is not None and crawler.completed
     
-    def add_completed_pull_number(self, pull_number: int):
+    def add_completed_pull_number(self, pull_number: int, checkpoint: MasterCheckpoint = None):
         """Track completed pull request"""
-        self.checkpoint.completed_pull_numbers.add(pull_number)
+        checkpoint = checkpoint or self.checkpoint
+        if pull_number not in checkpoint.completed_pull_numbers:
+            checkpoint.completed_pull_numbers.add(pull_number)
+            os.write(self._log_fd, b"P:%d\n" % pull_number)
     
-    def add_completed_commit_sha(self, commit_sha: str):
+    def add_completed_commit_sha(self, commit_sha: str, checkpoint: MasterCheckpoint = None):
         """Track completed commit"""
-        self.checkpoint.completed_commit_shas.add(commit_sha)
+        checkpoint = checkpoint or self.checkpoint
+        packed = _pack_sha(commit_sha)
+        if packed not in checkpoint.completed_commit_shas:
+            checkpoint.completed_commit_shas.add(packed)
+            os.write(self._log_fd, b"C:%s\n" % commit_sha.encode())
+    
+    def add_completed_pull_numbers(self, pull_numbers: Iterable[int], checkpoint: MasterCheckpoint = None):
+        """Track many completed pull requests with a single log write"""
+        checkpoint = checkpoint or self.checkpoint
+        new_numbers = set(pull_numbers) - checkpoint.completed_pull_numbers
+        if new_numbers:
+            checkpoint.completed_pull_numbers.update(new_numbers)
+            os.write(self._log_fd, b"".join(b"P:%d\n" % n for n in new_numbers))
+    
+    def add_completed_commit_shas(self, commit_shas: Iterable[str], checkpoint: MasterCheckpoint = None):
+        """Track many completed commits with a single log write"""
+        checkpoint = checkpoint or self.checkpoint
+        completed = checkpoint.completed_commit_shas
+        new_shas = {}
+        for commit_sha in commit_shas:
+            packed = _pack_sha(commit_sha)
+            if packed not in completed:
+                new_shas[packed] = commit_sha
+        if new_shas:
+            completed.update(new_shas)
+            os.write(self._log_fd, b"".join(b"C:%s\n" % sha.encode() for sha in new_shas.values()))
     
     def is_pull_completed(self, pull_number: int) -> bool:
         """Check if pull request is already processed"""
@@ -177,18 +355,12 @@ class CheckpointManager:
     
     def is_commit_completed(self, commit_sha: str) -> bool:
         """Check if commit is already processed"""
-        return commit_sha in self.checkpoint.completed_commit_shas
+        return _pack_sha(commit_sha) in self.checkpoint.completed_commit_shas
     
     def get_incomplete_crawlers(self) -> List[str]:
         """Get list of incomplete crawler names"""
-        from config import CRAWLER_SEQUENCE
-        
-        incomplete = []
-        for crawler_name in CRAWLER_SEQUENCE:
-            if not self.is_crawler_completed(crawler_name):
-                incomplete.append(crawler_name)
-        
-        return incomplete
+        completed = {name for name, crawler in self.checkpoint.crawlers.items() if crawler.completed}
+        return [name for name in CRAWLER_SEQUENCE if name not in completed]
     
     def get_resume_summary(self) -> Dict[str, Any]:
         """Get summary of what needs to be resumed"""
@@ -212,9 +384,30 @@ class CheckpointManager:
         return summary
     
     def cleanup_checkpoint(self):
-        """Remove checkpoint file (call after successful completion)"""
+        """Remove checkpoint files (call after successful completion)"""
         try:
             if os.path.exists(self.checkpoint_file):
                 os.remove(self.checkpoint_file)
+            
+            # Compact the completed log down to nothing
+            os.ftruncate(self._log_fd, 0)
+            if os.path.exists(self.completed_log_file):
+                os.remove(self.completed_log_file)
         except Exception as e:
-            logging.error(f"Failed to cleanup checkpoint: {e}")
\ No newline at end of file
+            logging.error(f"Failed to cleanup checkpoint: {e}")
+    
+    def _sync_log_and_dir(self):
+        """Flush the completed log and the directory entry of the renamed checkpoint"""
+        os.fsync(self._log_fd)
+        if self._dir_fd is not None:
+            os.fsync(self._dir_fd)
+    
+    def close(self):
+        """Release the checkpoint writer and file descriptors"""
+        self._writer.shutdown(wait=True)
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
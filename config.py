@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any
 
 @dataclass
@@ -14,6 +15,20 @@ class CrawlerConfig:
     max_requests_per_hour: int = 4800  # Conservative limit (GitHub allows 5000)
     rate_limit_buffer: int = 200       # Keep this many requests as buffer
     max_concurrent_requests: int = 10  # Parallel requests limit
+    single_commits_batch_size: int = 50  # Commits per single-commit batch
+    connection_pool_size: int = 64     # Max pooled HTTP connections to the API
+    keepalive_timeout: float = 75.0    # Seconds to keep idle connections open
+    connect_timeout: float = 10.0      # Seconds to establish a connection
+    read_timeout: float = 30.0         # Seconds to wait between response chunks
+    
+    # GraphQL settings
+    graphql_dependency_counts: bool = False  # Skip REST calls for PRs GraphQL reports as empty
+    graphql_batch_size: int = 50       # PRs per GraphQL count query
+    
+    # Response cache settings
+    response_cache: bool = True        # Revalidate GET responses with ETags (304s cost no rate limit)
+    cache_dir: str = os.path.expanduser('~/.cache/gh-crawler')  # Where the SQLite response caches live
+    cache_ttl_seconds: float = 86400.0  # Prune cached responses not revalidated within this
     
     # Retry settings
     max_retries: int = 3
@@ -23,20 +38,26 @@ class CrawlerConfig:
     # File settings
     base_folder: str = 'crawled-data'
     items_per_page: int = 100          # GitHub API max
+    write_queue_size: int = 256        # Pending data file writes per crawler
+    write_batch_size: int = 64         # Max files written per writer thread hop
+    single_commit_savers: int = 64     # Concurrent single-commit save tasks feeding the writer
+    single_commits_jsonl: bool = False  # Append single commits to JSONL shards instead of per-commit files
+    jsonl_shard_size: int = 10000      # Commits per JSONL shard
     
     # Progress settings
     progress_update_interval: float = 1.0  # Update progress every second
     
     # Checkpoint settings
-    checkpoint_interval: int = 50      # Save checkpoint every N operations
+    checkpoint_seconds: float = 30.0   # Save checkpoint in the background every N seconds
+    checkpoint_min_interval: float = 2.0  # Min seconds between non-forced saves
     
     def __post_init__(self):
         if not self.github_token:
             raise ValueError("GitHub token is required. Set GH_TOKEN environment variable.")
     
-    @property
+    @cached_property
     def headers(self) -> Dict[str, str]:
-        """Standard GitHub API headers"""
+        """Standard GitHub API headers (built once per config)"""
         return {
             'Accept': 'application/vnd.github+json',
             'Authorization': f'Bearer {self.github_token}',
@@ -47,7 +68,7 @@ class CrawlerConfig:
 config = CrawlerConfig()
 
 # Crawler types and their dependencies
-CRAWLER_SEQUENCE = [
+CRAWLER_SEQUENCE = (
     'pull_requests',    # Must be first (foundation)
     'commits',          # Must be second (foundation)
     'pr_files',         # Can be parallel
@@ -55,7 +76,7 @@ CRAWLER_SEQUENCE = [
     'pr_commits',       # Can be parallel
     'pr_comments',      # Can be parallel
     'single_commits',   # Must be last (depends on all previous)
-]
+)
 
 PARALLEL_CRAWLERS = {
     'pr_dependencies': ['pr_files', 'pr_reviews', 'pr_commits', 'pr_comments']
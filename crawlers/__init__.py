@@ -2,8 +2,16 @@
 GitHub Crawlers Package
 
 This package contains all the specialized crawlers for different types of GitHub data.
+
+Entry points should start the event loop with run_event_loop() so the crawlers run on
+uvloop's libuv-based event loop when it is installed (it is optional).
 """
 
+import asyncio
+import logging
+import sys
+from typing import Any, Coroutine
+
 from .base_crawler import BaseCrawler, BaseListCrawler
 from .pull_requests import PullRequestsCrawler
 from .commits import CommitsCrawler
@@ -27,12 +35,39 @@ CRAWLER_CLASSES = {
     'single_commits': SingleCommitsCrawler,
 }
 
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops if available, returning whether it was installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.getLogger(__name__).debug("Using uvloop event loop")
+    return True
+
+def run_event_loop(main: Coroutine) -> Any:
+    """Run a coroutine to completion, on a uvloop event loop if available"""
+    if sys.version_info < (3, 11):
+        install_uvloop()
+        return asyncio.run(main)
+    
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    
+    # A loop factory avoids swapping the global event loop policy (deprecated in 3.14)
+    logging.getLogger(__name__).debug("Using uvloop event loop")
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
 def create_crawler(crawler_type: str, repo_owner: str, repo_name: str, github_client, checkpoint_manager):
     """Factory function to create crawler instances"""
-    if crawler_type not in CRAWLER_CLASSES:
+    crawler_class = CRAWLER_CLASSES.get(crawler_type)
+    if crawler_class is None:
         raise ValueError(f"Unknown crawler type: {crawler_type}. Available: {list(CRAWLER_CLASSES.keys())}")
     
-    crawler_class = CRAWLER_CLASSES[crawler_type]
     return crawler_class(repo_owner, repo_name, github_client, checkpoint_manager)
 
 __all__ = [
@@ -47,5 +82,7 @@ __all__ = [
     'PRCommentsCrawler',
     'SingleCommitsCrawler',
     'CRAWLER_CLASSES',
-    'create_crawler'
+    'create_crawler',
+    'install_uvloop',
+    'run_event_loop'
 ]
\ No newline at end of file
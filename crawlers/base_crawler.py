@@ -1,15 +1,22 @@
 import abc
 import os
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from config import config
-from utils import write_json_file_async, ensure_folder_structure
+from utils import write_json_file, write_json_file_async, ensure_folder_structure, ensure_dir
 from progress_tracker import get_progress_tracker
 from checkpoint_manager import CheckpointManager
 
 class BaseCrawler(abc.ABC):
     """Abstract base class for all GitHub crawlers"""
     
+    # Name of this crawler for progress tracking
+    crawler_name: str
+    
+    # Folder (relative to the repository folder) where this crawler saves data
+    output_subfolder: str
+    
     def __init__(self, repo_owner: str, repo_name: str, github_client, checkpoint_manager: CheckpointManager):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
@@ -20,24 +27,27 @@ class BaseCrawler(abc.ABC):
         # Folder structure
         self.folder_name = f"{repo_owner}-{repo_name}"
         self.base_folder_path = f"{config.base_folder}/{self.folder_name}"
+        self.output_folder_path = f"{self.base_folder_path}/{self.output_subfolder}"
+        
+        # Directory listings cached per folder for existence checks
+        self._existing_files: Dict[str, Set[str]] = {}
+        
+        # Data files are handed to a single writer task that writes them in batches
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         
         # Progress tracking
         try:
             self.progress_tracker = get_progress_tracker()
         except RuntimeError:
             self.progress_tracker = None
-    
-    @property
-    @abc.abstractmethod
-    def crawler_name(self) -> str:
-        """Name of this crawler for progress tracking"""
-        pass
-    
-    @property
-    @abc.abstractmethod
-    def output_folder_path(self) -> str:
-        """Folder path where this crawler saves data"""
-        pass
+        
+        # Progress counted locally (event loop only) and flushed to the tracker periodically
+        self._local_counts = {'completed': 0, 'failed': 0, 'skipped': 0}
+        # Tracker method bound once, so flushes skip the lookups
+        self._increment_progress = (
+            self.progress_tracker.increment_crawler_progress if self.progress_tracker else None
+        )
     
     @abc.abstractmethod
     async def estimate_total_items(self) -> int:
@@ -71,10 +81,19 @@ class BaseCrawler(abc.ABC):
             
             # Ensure output folder exists
             ensure_folder_structure(self.base_folder_path)
-            os.makedirs(self.output_folder_path, exist_ok=True)
+            ensure_dir(self.output_folder_path)
             
-            # Run the actual crawling implementation
-            await self.crawl_implementation()
+            # Run the actual crawling implementation, checkpointing in the background
+            checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+            progress_task = asyncio.create_task(self._progress_flush_loop())
+            try:
+                await self.crawl_implementation()
+            finally:
+                checkpoint_task.cancel()
+                progress_task.cancel()
+                await asyncio.gather(checkpoint_task, progress_task, return_exceptions=True)
+                await self._stop_writer()
+                self._flush_progress()
             
             # Mark as completed
             self.checkpoint_manager.complete_crawler(self.crawler_name)
@@ -98,13 +117,29 @@ class BaseCrawler(abc.ABC):
                 self.crawler_name, completed, failed_item, skipped_item
             )
         
-        # Update progress tracker with thread safety
-        if self.progress_tracker:
-            if completed > 0 or failed > 0 or skipped > 0:
-                with self.progress_tracker._lock:
-                    self.progress_tracker.increment_crawler_progress(
-                        self.crawler_name, completed, failed, skipped
-                    )
+        # Count locally; _progress_flush_loop pushes the totals to the tracker
+        counts = self._local_counts
+        counts['completed'] += completed
+        counts['failed'] += failed
+        counts['skipped'] += skipped
+    
+    def _flush_progress(self):
+        """Push locally counted progress into the progress tracker"""
+        counts = self._local_counts
+        if not (counts['completed'] or counts['failed'] or counts['skipped']):
+            return
+        
+        if self._increment_progress:
+            self._increment_progress(
+                self.crawler_name, counts['completed'], counts['failed'], counts['skipped']
+            )
+        counts['completed'] = counts['failed'] = counts['skipped'] = 0
+    
+    async def _progress_flush_loop(self):
+        """Flush local progress counts every progress_update_interval seconds"""
+        while True:
+            await asyncio.sleep(config.progress_update_interval)
+            self._flush_progress()
     
     def set_total_and_complete_progress(self, actual_total: int):
         """Set actual total and mark all as completed (for bulk operations)"""
@@ -119,31 +154,106 @@ class BaseCrawler(abc.ABC):
                 self.crawler_name, completed=actual_total
             )
     
+    async def _checkpoint_loop(self):
+        """Save the checkpoint every checkpoint_seconds while the crawl runs"""
+        while True:
+            await asyncio.sleep(config.checkpoint_seconds)
+            await self.checkpoint_manager.save_checkpoint_async()
+    
+    def _start_writer(self):
+        """Start the data file writer task if it is not running"""
+        if self._writer_task is None:
+            self._write_queue = asyncio.Queue(maxsize=config.write_queue_size)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _stop_writer(self):
+        """Flush pending data file writes and stop the writer task"""
+        if self._writer_task is None:
+            return
+        await self._write_queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+        self._write_queue = None
+    
+    async def _writer_loop(self):
+        """Drain queued writes and write each batch in a single thread hop"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < config.write_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+            
+            if batch:
+                errors = await asyncio.to_thread(self._write_batch, batch)
+                for (_, _, future), error in zip(batch, errors):
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+                
+                completed = errors.count(None)
+                if completed:
+                    self.update_progress(completed=completed)
+            
+            if stop:
+                return
+    
+    @staticmethod
+    def _write_batch(batch: List[Tuple[Any, str, asyncio.Future]]) -> List[Optional[Exception]]:
+        """Write a batch of data files, returning the error (if any) for each"""
+        errors = []
+        for data, file_path, _ in batch:
+            try:
+                write_json_file(file_path, data)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+    
     async def save_data_async(self, data: Any, file_path: str, item_identifier: str = None):
         """Save data to file with error handling and progress updates"""
         try:
-            await write_json_file_async(file_path, data)
+            self._start_writer()
+            future = asyncio.get_running_loop().create_future()
+            await self._write_queue.put((data, file_path, future))
+            await future
+            
+            folder, file_name = os.path.split(file_path)
+            existing = self._existing_files.get(folder)
+            if existing is not None:
+                existing.add(file_name)
             
             if item_identifier:
                 self.logger.debug(f"Saved {item_identifier} to {file_path}")
                 
         except Exception as e:
             self.logger.error(f"Failed to save data to {file_path}: {e}")
-            if self.progress_tracker:
-                with self.progress_tracker._lock:
-                    self.progress_tracker.increment_crawler_progress(
-                        self.crawler_name, failed=1
-                    )
+            self._local_counts['failed'] += 1
             raise
     
+    def _list_existing_files(self, folder: str) -> Set[str]:
+        """Get the cached set of file names in a folder, scanning it on first use"""
+        existing = self._existing_files.get(folder)
+        if existing is None:
+            try:
+                with os.scandir(folder) as entries:
+                    existing = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing = set()
+            self._existing_files[folder] = existing
+        return existing
+    
     def should_skip_existing(self, file_path: str) -> bool:
         """Check if file already exists and should be skipped"""
-        if os.path.exists(file_path):
-            if self.progress_tracker:
-                with self.progress_tracker._lock:
-                    self.progress_tracker.increment_crawler_progress(
-                        self.crawler_name, skipped=1
-                    )
+        folder, file_name = os.path.split(file_path)
+        if file_name in self._list_existing_files(folder):
+            self._local_counts['skipped'] += 1
             return True
         return False
     
@@ -162,10 +272,7 @@ class BaseCrawler(abc.ABC):
             
             # Process batch
             await process_func(batch)
-            
-            # Save checkpoint periodically
-            if (i + 1) % config.checkpoint_interval == 0:
-                self.checkpoint_manager.save_checkpoint()
+            self.checkpoint_manager.tick()
 
 class BaseListCrawler(BaseCrawler):
     """Base class for crawlers that fetch complete datasets at once"""
@@ -4,13 +4,8 @@ from .base_crawler import BaseListCrawler
 class CommitsCrawler(BaseListCrawler):
     """Crawler for GitHub repository commits"""
     
-    @property
-    def crawler_name(self) -> str:
-        return "commits"
-    
-    @property
-    def output_folder_path(self) -> str:
-        return f"{self.base_folder_path}/commit"
+    crawler_name = "commits"
+    output_subfolder = "commit"
     
     def get_api_method(self):
         """Get the GitHub client method for commits"""
@@ -23,8 +18,7 @@ class CommitsCrawler(BaseListCrawler):
     async def post_process_data(self, data: List[Dict[str, Any]]):
         """Post-process commits data to track commit SHAs"""
         # Track completed commit SHAs for single commit crawler
-        for commit in data:
-            if 'sha' in commit:
-                self.checkpoint_manager.add_completed_commit_sha(commit['sha'])
+        shas = [commit.get('sha') for commit in data]
+        self.checkpoint_manager.add_completed_commit_shas(filter(None, shas))
         
         self.logger.info(f"Tracked {len(data)} commit SHAs for single commit crawler")
\ No newline at end of file
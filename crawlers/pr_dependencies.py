@@ -1,34 +1,46 @@
 import os
-import json
 import asyncio
-from typing import Dict, Any, List
+import ijson
+from typing import Dict, Any, List, Set
 from .base_crawler import BaseCrawler
-from utils import get_all_pull_numbers
+from utils import get_all_pull_numbers, ensure_dir, gather_bounded, open_json_stream
 from github_client import GitHubAPIError
+from config import config
+
+# GitHub client method that fetches each dependency type
+API_METHOD_NAMES = {
+    'files': 'get_pull_files',
+    'reviews': 'get_pull_reviews',
+    'commits': 'get_pull_commits',
+    'comments': 'get_pull_review_comments',
+}
+
+# GraphQL count that proves a dependency type is empty for a PR
+# (review comments always belong to a review, so zero reviews means zero comments)
+GRAPHQL_COUNT_FIELDS = {
+    'files': 'files',
+    'reviews': 'reviews',
+    'commits': 'commits',
+    'comments': 'reviews',
+}
 
 class PRDependenciesCrawler(BaseCrawler):
     """Crawler for pull request dependencies (files, reviews, commits, comments)"""
     
+    output_subfolder = "pull"
+    
     def __init__(self, repo_owner: str, repo_name: str, github_client, checkpoint_manager, dependency_type: str):
         super().__init__(repo_owner, repo_name, github_client, checkpoint_manager)
         self.dependency_type = dependency_type
+        self.crawler_name = f"pr_{dependency_type}"
+        
+        # Per-PR output folders are {prefix}{pr_number}{suffix}
+        self._pr_dep_prefix = f"{self.output_folder_path}/"
+        self._pr_dep_suffix = f"/{dependency_type}"
         self.pull_numbers = []
         
-        # API method mapping
-        self.api_methods = {
-            'files': self.github_client.get_pull_files,
-            'reviews': self.github_client.get_pull_reviews,
-            'commits': self.github_client.get_pull_commits,
-            'comments': self.github_client.get_pull_review_comments
-        }
-    
-    @property
-    def crawler_name(self) -> str:
-        return f"pr_{self.dependency_type}"
-    
-    @property
-    def output_folder_path(self) -> str:
-        return f"{self.base_folder_path}/pull"
+        # API method for this dependency type, resolved once
+        self._api_method = getattr(github_client, API_METHOD_NAMES[dependency_type])
     
     async def estimate_total_items(self) -> int:
         """Estimate based on number of pull requests"""
@@ -38,9 +50,9 @@ class PRDependenciesCrawler(BaseCrawler):
         all_data_file = f"{pull_folder}/all_data.json"
         if os.path.exists(all_data_file):
             try:
-                with open(all_data_file, 'r') as f:
-                    pull_requests = json.load(f)
-                self.pull_numbers = [pr['number'] for pr in pull_requests if 'number' in pr]
+                # Stream only the PR numbers instead of loading every PR into memory
+                with open_json_stream(all_data_file) as f:
+                    self.pull_numbers = list(ijson.items(f, 'item.number'))
                 self.logger.info(f"Found {len(self.pull_numbers)} PR numbers from all_data.json")
             except Exception as e:
                 self.logger.error(f"Failed to read PR numbers from all_data.json: {e}")
@@ -59,53 +71,102 @@ class PRDependenciesCrawler(BaseCrawler):
             
         self.logger.info(f"Starting {self.dependency_type} crawl for {len(self.pull_numbers)} PRs")
         
-        # Get API method
-        api_method = self.api_methods[self.dependency_type]
-        
-        # Process PRs in parallel batches
-        batch_size = min(10, len(self.pull_numbers))  # Conservative parallel processing
+        # Skip PRs whose dependency data already exists (one directory scan)
+        existing = await asyncio.to_thread(self._scan_existing_outputs)
         
-        async def process_pr_batch(pr_batch: List[int]):
-            """Process a batch of PRs"""
-            tasks = []
-            for pr_number in pr_batch:
-                # Check if this specific PR's dependency already exists
-                output_folder = f"{self.output_folder_path}/{pr_number}/{self.dependency_type}"
-                output_file = f"{output_folder}/all_data.json"
-                
-                if os.path.exists(output_file):
-                    self.update_progress(skipped=1, skipped_item=str(pr_number))
-                    continue
-                
-                tasks.append(self._crawl_single_pr(pr_number, api_method))
+        pending = []
+        for pr_number in self.pull_numbers:
+            if pr_number in existing:
+                self.update_progress(skipped=1, skipped_item=str(pr_number))
+                continue
             
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            pending.append(pr_number)
+        
+        # Create every output folder up front, off the event loop
+        await asyncio.to_thread(self._create_output_folders, pending)
         
-        # Process all batches
-        await self.process_in_batches(
-            self.pull_numbers, 
-            batch_size,
-            process_pr_batch,
-            f"Crawling PR {self.dependency_type}"
+        if config.graphql_dependency_counts and pending:
+            pending = await self._save_empty_dependencies(pending)
+        
+        if self.progress_tracker:
+            self.progress_tracker.update_operation(
+                f"Crawling PR {self.dependency_type} for {len(pending)} PRs"
+            )
+        
+        # Keep a fixed number of PRs in flight instead of waiting on batch barriers
+        await gather_bounded(self._process_pr, pending, config.max_concurrent_requests,
+                             return_exceptions=True)
+    
+    async def _process_pr(self, pr_number: int):
+        """Crawl one PR's dependency data and count it toward the next checkpoint"""
+        await self._crawl_single_pr(pr_number)
+        self.checkpoint_manager.tick()
+    
+    def _scan_existing_outputs(self) -> Set[int]:
+        """Get PR numbers that already have this dependency type saved"""
+        existing = set()
+        try:
+            with os.scandir(self.output_folder_path) as entries:
+                for entry in entries:
+                    if not (entry.name.isdigit() and entry.is_dir()):
+                        continue
+                    if os.path.exists(f"{entry.path}/{self.dependency_type}/all_data.json"):
+                        existing.add(int(entry.name))
+        except FileNotFoundError:
+            pass
+        return existing
+    
+    async def _save_empty_dependencies(self, pr_numbers: List[int]) -> List[int]:
+        """Save empty data for PRs that GraphQL reports have none, returning the rest"""
+        if self.progress_tracker:
+            self.progress_tracker.update_operation(
+                f"Checking PR {self.dependency_type} counts via GraphQL"
+            )
+        
+        counts = await self.github_client.get_pull_dependency_counts(
+            self.repo_owner, self.repo_name, pr_numbers
         )
+        count_field = GRAPHQL_COUNT_FIELDS[self.dependency_type]
+        
+        remaining = []
+        empty = []
+        for pr_number in pr_numbers:
+            if counts.get(pr_number, {}).get(count_field) == 0:
+                empty.append(pr_number)
+            else:
+                remaining.append(pr_number)
+        
+        if empty:
+            await asyncio.gather(*[
+                self.save_data_async(
+                    [], self._pr_output_folder(pr_number) + "/all_data.json",
+                    f"PR_{pr_number}_{self.dependency_type}"
+                )
+                for pr_number in empty
+            ], return_exceptions=True)
+            self.logger.info(f"Saved {len(empty)} PRs with no {self.dependency_type} without REST calls")
+        
+        return remaining
+    
+    def _pr_output_folder(self, pr_number: int) -> str:
+        """Folder where this dependency type is saved for a PR"""
+        return self._pr_dep_prefix + str(pr_number) + self._pr_dep_suffix
     
-    async def _crawl_single_pr(self, pr_number: int, api_method):
+    def _create_output_folders(self, pr_numbers: List[int]):
+        """Create the dependency output folder for each PR"""
+        for pr_number in pr_numbers:
+            ensure_dir(self._pr_output_folder(pr_number))
+    
+    async def _crawl_single_pr(self, pr_number: int):
         """Crawl dependency data for a single PR"""
-        output_folder = f"{self.output_folder_path}/{pr_number}/{self.dependency_type}"
+        output_folder = self._pr_output_folder(pr_number)
         output_file = f"{output_folder}/all_data.json"
         
-        # Skip if already exists
-        if os.path.exists(output_file):
-            self.update_progress(skipped=1, skipped_item=str(pr_number))
-            return
-        
         try:
             # Fetch data for this PR
-            data = await api_method(self.repo_owner, self.repo_name, pr_number)
+            data = await self._api_method(self.repo_owner, self.repo_name, pr_number)
             
-            # Create folder and save data (even if empty list)
-            os.makedirs(output_folder, exist_ok=True)
+            # Save data (even if empty list)
             await self.save_data_async(data, output_file, f"PR_{pr_number}_{self.dependency_type}")
             
             self.logger.debug(f"Completed {self.dependency_type} for PR {pr_number}: {len(data)} items")
@@ -114,7 +175,6 @@ class PRDependenciesCrawler(BaseCrawler):
             if e.status_code == 404:
                 # PR might not have this type of data (normal) - save empty data
                 self.logger.debug(f"No {self.dependency_type} found for PR {pr_number} (404)")
-                os.makedirs(output_folder, exist_ok=True)
                 await self.save_data_async([], output_file, f"PR_{pr_number}_{self.dependency_type}")
             else:
                 self.logger.error(f"API error for PR {pr_number} {self.dependency_type}: {e}")
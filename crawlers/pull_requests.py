@@ -4,13 +4,8 @@ from .base_crawler import BaseListCrawler
 class PullRequestsCrawler(BaseListCrawler):
     """Crawler for GitHub pull requests"""
     
-    @property
-    def crawler_name(self) -> str:
-        return "pull_requests"
-    
-    @property
-    def output_folder_path(self) -> str:
-        return f"{self.base_folder_path}/pull"
+    crawler_name = "pull_requests"
+    output_subfolder = "pull"
     
     def get_api_method(self):
         """Get the GitHub client method for pull requests"""
@@ -23,8 +18,7 @@ class PullRequestsCrawler(BaseListCrawler):
     async def post_process_data(self, data: List[Dict[str, Any]]):
         """Post-process pull requests data to track PR numbers"""
         # Track completed pull numbers for dependency crawlers
-        for pr in data:
-            if 'number' in pr:
-                self.checkpoint_manager.add_completed_pull_number(pr['number'])
+        numbers = [pr.get('number') for pr in data]
+        self.checkpoint_manager.add_completed_pull_numbers(n for n in numbers if n is not None)
         
         self.logger.info(f"Tracked {len(data)} pull request numbers for dependency crawlers")
\ No newline at end of file
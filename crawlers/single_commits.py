@@ -1,28 +1,24 @@
 import os
 import asyncio
-from typing import List, Set, Dict, Any
+import functools
+from typing import List, Set, Dict, Any, Union
 from .base_crawler import BaseCrawler
-from utils import get_all_unique_commit_shas, get_existing_single_commits
+from utils import get_all_unique_commit_shas, get_existing_single_commits, JsonlShardWriter
 from github_client import GitHubAPIError
 from config import config
 
 class SingleCommitsCrawler(BaseCrawler):
     """Crawler for detailed individual commit data"""
     
+    crawler_name = "single_commits"
+    output_subfolder = "commit/all"
+    
     def __init__(self, repo_owner: str, repo_name: str, github_client, checkpoint_manager):
         super().__init__(repo_owner, repo_name, github_client, checkpoint_manager)
         self.all_commit_shas: List[str] = []
         self.existing_commits: Set[str] = set()
         self.remaining_commits: List[str] = []
     
-    @property
-    def crawler_name(self) -> str:
-        return "single_commits"
-    
-    @property
-    def output_folder_path(self) -> str:
-        return f"{self.base_folder_path}/commit/all"
-    
     async def estimate_total_items(self) -> int:
         """Estimate based on unique commit SHAs minus already existing ones"""
         # Get all unique commit SHAs from previous crawls
@@ -33,7 +29,7 @@ class SingleCommitsCrawler(BaseCrawler):
         
         # Calculate remaining
         remaining_shas = set(self.all_commit_shas) - self.existing_commits
-        self.remaining_commits = sorted(list(remaining_shas))
+        self.remaining_commits = list(remaining_shas)
         
         self.logger.info(f"Found {len(self.all_commit_shas)} total commits, "
                         f"{len(self.existing_commits)} already processed, "
@@ -49,51 +45,88 @@ class SingleCommitsCrawler(BaseCrawler):
         
         self.logger.info(f"Starting single commits crawl for {len(self.remaining_commits)} commits")
         
-        # Determine optimal batch size based on rate limit
-        rate_limit_status = self.github_client.rate_limiter.get_status_summary()
+        # Request pacing is left to the client's rate limiter
+        batch_size = config.single_commits_batch_size
         
-        # Conservative batch size based on remaining rate limit
-        if rate_limit_status['remaining'] < 500:
-            batch_size = 5  # Very conservative
-        elif rate_limit_status['remaining'] < 1000:
-            batch_size = 10  # Moderate
+        # Saves run in their own tasks so disk writes overlap the next fetch
+        save_queue: asyncio.Queue = asyncio.Queue(maxsize=batch_size * 2)
+        if config.single_commits_jsonl:
+            shard_writer = JsonlShardWriter(self.output_folder_path, 'commits', config.jsonl_shard_size)
+            savers = [asyncio.create_task(self._shard_save_worker(save_queue, shard_writer))]
         else:
-            batch_size = min(20, config.max_concurrent_requests)  # Aggressive
-        
-        self.logger.info(f"Using batch size: {batch_size}")
+            shard_writer = None
+            savers = [
+                asyncio.create_task(self._save_worker(save_queue))
+                for _ in range(config.single_commit_savers)
+            ]
         
-        # Process commits in batches
-        await self.process_in_batches(
-            self.remaining_commits,
-            batch_size, 
-            self._process_commit_batch,
-            "Processing commit batches"
-        )
+        try:
+            # Process commits in batches
+            await self.process_in_batches(
+                self.remaining_commits,
+                batch_size, 
+                functools.partial(self._fetch_commit_batch, save_queue=save_queue),
+                "Processing commit batches"
+            )
+        finally:
+            for _ in savers:
+                await save_queue.put(None)
+            await asyncio.gather(*savers)
+            if shard_writer:
+                shard_writer.close()
     
-    async def _process_commit_batch(self, commit_batch: List[str]):
-        """Process a batch of commits in parallel"""
-        # Use GitHub client's batch method for optimal performance
+    async def _fetch_commit_batch(self, commit_batch: List[str], save_queue: asyncio.Queue):
+        """Fetch a batch of commits in parallel and queue them for saving"""
+        # Use GitHub client's batch method for optimal performance. Per-commit files
+        # get the response body as-is; JSONL shards need parsed dicts to re-encode as lines
         results = await self.github_client.batch_get_single_commits(
-            self.repo_owner, self.repo_name, commit_batch
+            self.repo_owner, self.repo_name, commit_batch,
+            raw=not config.single_commits_jsonl
         )
         
-        # Save results
-        save_tasks = []
         for commit_sha, commit_data in results.items():
             if commit_data is None:
                 self.update_progress(failed=1, failed_item=commit_sha)
                 continue
             
+            await save_queue.put((commit_sha, commit_data))
+    
+    async def _save_worker(self, save_queue: asyncio.Queue):
+        """Save queued commits until a None sentinel arrives"""
+        while True:
+            item = await save_queue.get()
+            if item is None:
+                return
+            
+            commit_sha, commit_data = item
             file_path = f"{self.output_folder_path}/{commit_sha}.json"
-            save_tasks.append(
-                self._save_single_commit(commit_sha, commit_data, file_path)
-            )
-        
-        # Save all files in this batch
-        if save_tasks:
-            await asyncio.gather(*save_tasks, return_exceptions=True)
+            await self._save_single_commit(commit_sha, commit_data, file_path)
+    
+    async def _shard_save_worker(self, save_queue: asyncio.Queue, shard_writer: JsonlShardWriter):
+        """Append queued commits to JSONL shards until a None sentinel arrives"""
+        while True:
+            batch = [await save_queue.get()]
+            while len(batch) < config.write_batch_size and not save_queue.empty():
+                batch.append(save_queue.get_nowait())
+            
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+            
+            if batch:
+                try:
+                    await asyncio.to_thread(shard_writer.append, [commit_data for _, commit_data in batch])
+                    self.checkpoint_manager.add_completed_commit_shas(sha for sha, _ in batch)
+                    self.update_progress(completed=len(batch))
+                except Exception as e:
+                    self.logger.error(f"Failed to append {len(batch)} commits to shard: {e}")
+                    for commit_sha, _ in batch:
+                        self.update_progress(failed=1, failed_item=commit_sha)
+            
+            if stop:
+                return
     
-    async def _save_single_commit(self, commit_sha: str, commit_data: Dict[str, Any], file_path: str):
+    async def _save_single_commit(self, commit_sha: str, commit_data: Union[bytes, Dict[str, Any]], file_path: str):
         """Save single commit data"""
         try:
             await self.save_data_async(commit_data, file_path, commit_sha)
@@ -4,11 +4,12 @@ Data Quality Analyzer for Crawled GitHub Repositories
 Analyzes the completeness and quality of crawled data for reviewer recommendation systems.
 """
 
-import json
 import os
 import sys
-from typing import Dict, Any, List
-from collections import defaultdict
+from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from utils import count_json_array_items, count_existing_single_commits, stream_pr_states
 
 def analyze_repository_quality(base_folder_path: str) -> Dict[str, Any]:
     """Comprehensive analysis of repository data quality"""
@@ -25,14 +26,15 @@ def analyze_repository_quality(base_folder_path: str) -> Dict[str, Any]:
     }
     
     try:
-        # Analyze pull requests
-        analysis['pull_requests'] = analyze_pull_requests(base_folder_path)
-        
-        # Analyze reviews and comments
-        analysis['reviews'], analysis['comments'] = analyze_reviews_and_comments(base_folder_path)
-        
-        # Analyze commits
-        analysis['commits'] = analyze_commits(base_folder_path)
+        # The three scans read separate trees (pull/, pull/<n>/, commit/), so overlap their I/O
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pull_requests = executor.submit(analyze_pull_requests, base_folder_path)
+            reviews_and_comments = executor.submit(analyze_reviews_and_comments, base_folder_path)
+            commits = executor.submit(analyze_commits, base_folder_path)
+            
+            analysis['pull_requests'] = pull_requests.result()
+            analysis['reviews'], analysis['comments'] = reviews_and_comments.result()
+            analysis['commits'] = commits.result()
         
         # Determine overall quality
         analysis['overall_quality'] = determine_overall_quality(analysis)
@@ -60,17 +62,13 @@ def analyze_pull_requests(base_folder_path: str) -> Dict[str, Any]:
     all_data_file = f"{pull_folder}/all_data.json"
     if os.path.exists(all_data_file):
         try:
-            with open(all_data_file, 'r') as f:
-                pull_data = json.load(f)
-                pr_analysis['total_count'] = len(pull_data)
-                pr_analysis['has_data'] = len(pull_data) > 0
-                pr_analysis['status'] = 'available'
-                
-                # Analyze PR states
-                states = defaultdict(int)
-                for pr in pull_data:
-                    states[pr.get('state', 'unknown')] += 1
-                pr_analysis['states'] = dict(states)
+            # Stream parse events so only the PR count and states are ever held in memory
+            total_count, states = stream_pr_states(all_data_file)
+            
+            pr_analysis['total_count'] = total_count
+            pr_analysis['has_data'] = total_count > 0
+            pr_analysis['status'] = 'available'
+            pr_analysis['states'] = states
                 
         except Exception as e:
             pr_analysis['error'] = str(e)
@@ -78,7 +76,7 @@ def analyze_pull_requests(base_folder_path: str) -> Dict[str, Any]:
     
     return pr_analysis
 
-def analyze_reviews_and_comments(base_folder_path: str) -> tuple:
+def analyze_reviews_and_comments(base_folder_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Analyze review and comment data across all PRs"""
     pull_folder = f"{base_folder_path}/pull"
     
@@ -102,7 +100,8 @@ def analyze_reviews_and_comments(base_folder_path: str) -> tuple:
         return reviews_analysis, comments_analysis
     
     # Get all PR directories
-    pr_dirs = [d for d in os.listdir(pull_folder) if d.isdigit()]
+    with os.scandir(pull_folder) as it:
+        pr_dirs = [e for e in it if e.name.isdigit() and e.is_dir(follow_symlinks=False)]
     total_prs = len(pr_dirs)
     
     if total_prs == 0:
@@ -111,40 +110,30 @@ def analyze_reviews_and_comments(base_folder_path: str) -> tuple:
     reviews_analysis['status'] = 'available'
     comments_analysis['status'] = 'available'
     
-    for pr_dir in pr_dirs:
-        pr_path = f"{pull_folder}/{pr_dir}"
+    # Per-PR scans are file I/O bound, so spread them over threads and aggregate here
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_scan_pr_folder, [pr_dir.path for pr_dir in pr_dirs], chunksize=64)
         
-        # Check reviews
-        reviews_file = f"{pr_path}/reviews/all_data.json"
-        if os.path.exists(reviews_file):
-            try:
-                with open(reviews_file, 'r') as f:
-                    review_data = json.load(f)
-                    if len(review_data) > 0:
-                        reviews_analysis['prs_with_reviews'] += 1
-                        reviews_analysis['total_reviews'] += len(review_data)
-                    else:
-                        reviews_analysis['prs_without_reviews'] += 1
-            except:
-                reviews_analysis['prs_without_reviews'] += 1
-        else:
-            reviews_analysis['prs_without_reviews'] += 1
-        
-        # Check comments
-        comments_file = f"{pr_path}/comments/all_data.json"
-        if os.path.exists(comments_file):
-            try:
-                with open(comments_file, 'r') as f:
-                    comment_data = json.load(f)
-                    if len(comment_data) > 0:
-                        comments_analysis['prs_with_comments'] += 1
-                        comments_analysis['total_comments'] += len(comment_data)
-                    else:
-                        comments_analysis['prs_without_comments'] += 1
-            except:
-                comments_analysis['prs_without_comments'] += 1
-        else:
-            comments_analysis['prs_without_comments'] += 1
+        # Typed local counters keep the loop free of dict lookups
+        prs_with_reviews: int = 0
+        total_reviews: int = 0
+        prs_with_comments: int = 0
+        total_comments: int = 0
+        for review_count, comment_count in results:
+            if review_count > 0:
+                prs_with_reviews += 1
+                total_reviews += review_count
+            if comment_count > 0:
+                prs_with_comments += 1
+                total_comments += comment_count
+    
+    reviews_analysis['prs_with_reviews'] = prs_with_reviews
+    reviews_analysis['prs_without_reviews'] = total_prs - prs_with_reviews
+    reviews_analysis['total_reviews'] = total_reviews
+    comments_analysis['prs_with_comments'] = prs_with_comments
+    comments_analysis['prs_without_comments'] = total_prs - prs_with_comments
+    comments_analysis['total_comments'] = total_comments
     
     # Calculate percentages
     if total_prs > 0:
@@ -153,6 +142,25 @@ def analyze_reviews_and_comments(base_folder_path: str) -> tuple:
     
     return reviews_analysis, comments_analysis
 
+# Per-PR file suffixes, appended to each PR folder path in the hot scan loop
+_REVIEWS_FILE_SUFFIX = "/reviews/all_data.json"
+_COMMENTS_FILE_SUFFIX = "/comments/all_data.json"
+
+def _count_items_or_zero(file_path: str) -> int:
+    """Count a JSON array file's items, treating missing or unreadable files as empty"""
+    # No existence check first: a failed open is the one syscall a missing file costs
+    try:
+        return count_json_array_items(file_path)
+    except Exception:
+        return 0
+
+def _scan_pr_folder(pr_path: str) -> Tuple[int, int]:
+    """Return the (reviews, comments) counts saved for one PR"""
+    return (
+        _count_items_or_zero(pr_path + _REVIEWS_FILE_SUFFIX),
+        _count_items_or_zero(pr_path + _COMMENTS_FILE_SUFFIX),
+    )
+
 def analyze_commits(base_folder_path: str) -> Dict[str, Any]:
     """Analyze commit data"""
     commit_analysis = {
@@ -166,18 +174,15 @@ def analyze_commits(base_folder_path: str) -> Dict[str, Any]:
     commits_file = f"{base_folder_path}/commit/all_data.json"
     if os.path.exists(commits_file):
         try:
-            with open(commits_file, 'r') as f:
-                commit_data = json.load(f)
-                commit_analysis['total_commits'] = len(commit_data)
-                commit_analysis['status'] = 'available'
+            commit_analysis['total_commits'] = count_json_array_items(commits_file)
+            commit_analysis['status'] = 'available'
         except:
             commit_analysis['status'] = 'corrupted'
     
     # Check individual commits
     individual_commits_folder = f"{base_folder_path}/commit/all"
     if os.path.exists(individual_commits_folder):
-        individual_files = [f for f in os.listdir(individual_commits_folder) if f.endswith('.json')]
-        commit_analysis['individual_commits'] = len(individual_files)
+        commit_analysis['individual_commits'] = count_existing_single_commits(individual_commits_folder)
         
         if commit_analysis['total_commits'] > 0:
             commit_analysis['individual_commit_percentage'] = (
@@ -258,62 +263,66 @@ def generate_recommendations(analysis: Dict[str, Any]) -> List[str]:
     
     return recommendations
 
-def print_analysis_report(analysis: Dict[str, Any]):
+def print_analysis_report(analysis: Dict[str, Any]) -> None:
     """Print a formatted analysis report"""
+    # Built up and written once, rather than one write per line
+    lines: List[str] = []
     
-    print("=" * 80)
-    print("GITHUB REPOSITORY DATA QUALITY ANALYSIS")
-    print("=" * 80)
-    print(f"Repository: {analysis['repository_path']}")
-    print(f"Overall Quality: {analysis['overall_quality'].upper()}")
-    print(f"Reviewer Recommendation Viability: {analysis['usability_for_reviewer_recommendation'].upper()}")
-    print()
+    lines.append("=" * 80)
+    lines.append("GITHUB REPOSITORY DATA QUALITY ANALYSIS")
+    lines.append("=" * 80)
+    lines.append(f"Repository: {analysis['repository_path']}")
+    lines.append(f"Overall Quality: {analysis['overall_quality'].upper()}")
+    lines.append(f"Reviewer Recommendation Viability: {analysis['usability_for_reviewer_recommendation'].upper()}")
+    lines.append("")
     
     # Pull Requests
     pr = analysis['pull_requests']
-    print(f"PULL REQUESTS:")
-    print(f"  Total: {pr['total_count']}")
-    print(f"  Status: {pr['status']}")
+    lines.append(f"PULL REQUESTS:")
+    lines.append(f"  Total: {pr['total_count']}")
+    lines.append(f"  Status: {pr['status']}")
     if 'states' in pr:
         for state, count in pr['states'].items():
-            print(f"  {state}: {count}")
-    print()
+            lines.append(f"  {state}: {count}")
+    lines.append("")
     
     # Reviews
     rev = analysis['reviews']
-    print(f"REVIEWS:")
-    print(f"  PRs with reviews: {rev['prs_with_reviews']}")
-    print(f"  PRs without reviews: {rev['prs_without_reviews']}")
-    print(f"  Total reviews: {rev['total_reviews']}")
-    print(f"  Review coverage: {rev['review_percentage']:.1f}%")
-    print()
+    lines.append(f"REVIEWS:")
+    lines.append(f"  PRs with reviews: {rev['prs_with_reviews']}")
+    lines.append(f"  PRs without reviews: {rev['prs_without_reviews']}")
+    lines.append(f"  Total reviews: {rev['total_reviews']}")
+    lines.append(f"  Review coverage: {rev['review_percentage']:.1f}%")
+    lines.append("")
     
     # Comments
     com = analysis['comments']
-    print(f"COMMENTS:")
-    print(f"  PRs with comments: {com['prs_with_comments']}")
-    print(f"  PRs without comments: {com['prs_without_comments']}")
-    print(f"  Total comments: {com['total_comments']}")
-    print(f"  Comment coverage: {com['comment_percentage']:.1f}%")
-    print()
+    lines.append(f"COMMENTS:")
+    lines.append(f"  PRs with comments: {com['prs_with_comments']}")
+    lines.append(f"  PRs without comments: {com['prs_without_comments']}")
+    lines.append(f"  Total comments: {com['total_comments']}")
+    lines.append(f"  Comment coverage: {com['comment_percentage']:.1f}%")
+    lines.append("")
     
     # Commits
     commits = analysis['commits']
-    print(f"COMMITS:")
-    print(f"  Total commits: {commits['total_commits']}")
-    print(f"  Individual commit details: {commits['individual_commits']}")
-    print(f"  Individual commit coverage: {commits['individual_commit_percentage']:.1f}%")
-    print()
+    lines.append(f"COMMITS:")
+    lines.append(f"  Total commits: {commits['total_commits']}")
+    lines.append(f"  Individual commit details: {commits['individual_commits']}")
+    lines.append(f"  Individual commit coverage: {commits['individual_commit_percentage']:.1f}%")
+    lines.append("")
     
     # Recommendations
-    print("RECOMMENDATIONS:")
+    lines.append("RECOMMENDATIONS:")
     for i, rec in enumerate(analysis['recommendations'], 1):
-        print(f"  {i}. {rec}")
-    print()
+        lines.append(f"  {i}. {rec}")
+    lines.append("")
+    
+    lines.append("=" * 80)
     
-    print("=" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def main():
+def main() -> None:
     """Main function for command line usage"""
     if len(sys.argv) != 2:
         print("Usage: python data_quality_analyzer.py <path_to_crawled_data>")
@@ -332,8 +341,8 @@ def main():
     # Save detailed analysis to file
     output_file = f"{repo_path}/data_quality_analysis.json"
     try:
-        with open(output_file, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
         print(f"Detailed analysis saved to: {output_file}")
     except Exception as e:
         print(f"Warning: Could not save analysis file: {e}")
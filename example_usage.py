@@ -6,14 +6,25 @@ This script demonstrates how to use the crawler programmatically
 and how to access the crawled data for analysis.
 """
 
-import asyncio
-import json
+import functools
+from collections import Counter
 import os
+import orjson
 from pathlib import Path
 from unified_crawler import crawl_repository
-from utils import validate_crawled_data, get_folder_size_mb
+from crawlers import run_event_loop
+from utils import validate_crawled_data, get_folder_size_mb, count_existing_single_commits
 from config import config
 
+# Shared stand-in for missing nested objects, so lookups don't allocate a new dict per item
+_EMPTY: dict = {}
+
+@functools.lru_cache(maxsize=8)
+def _load_json(file_path: str):
+    """Parse a JSON file once and share the result between the examples (treat it as read-only)"""
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
 async def example_crawl_small_repo():
     """Example: Crawl a small repository"""
     print("🎯 Example 1: Crawling a small repository")
@@ -44,48 +55,39 @@ async def example_analyze_crawled_data(base_folder: str):
     # Load pull requests
     pull_requests_file = f"{base_folder}/pull/all_data.json"
     if os.path.exists(pull_requests_file):
-        with open(pull_requests_file, 'r') as f:
-            pull_requests = json.load(f)
+        pull_requests = _load_json(pull_requests_file)
         
         print(f"📊 Pull Requests Analysis:")
         print(f"   Total PRs: {len(pull_requests)}")
         
         # Analyze PR states
-        states = {}
-        authors = {}
-        for pr in pull_requests:
-            state = pr.get('state', 'unknown')
-            author = pr.get('user', {}).get('login', 'unknown')
-            
-            states[state] = states.get(state, 0) + 1
-            authors[author] = authors.get(author, 0) + 1
+        states = Counter(pr.get('state', 'unknown') for pr in pull_requests)
+        authors = Counter((pr.get('user') or _EMPTY).get('login', 'unknown') for pr in pull_requests)
         
         print(f"   States: {dict(states)}")
-        print(f"   Top contributors: {sorted(authors.items(), key=lambda x: x[1], reverse=True)[:5]}")
+        print(f"   Top contributors: {authors.most_common(5)}")
     
     # Load commits
     commits_file = f"{base_folder}/commit/all_data.json"
     if os.path.exists(commits_file):
-        with open(commits_file, 'r') as f:
-            commits = json.load(f)
+        commits = _load_json(commits_file)
         
         print(f"\n📊 Commits Analysis:")
         print(f"   Total commits: {len(commits)}")
         
         # Analyze commit authors
-        commit_authors = {}
-        for commit in commits:
-            author = commit.get('commit', {}).get('author', {}).get('name', 'unknown')
-            commit_authors[author] = commit_authors.get(author, 0) + 1
+        commit_authors = Counter(
+            ((commit.get('commit') or _EMPTY).get('author') or _EMPTY).get('name', 'unknown')
+            for commit in commits
+        )
         
-        print(f"   Top committers: {sorted(commit_authors.items(), key=lambda x: x[1], reverse=True)[:5]}")
+        print(f"   Top committers: {commit_authors.most_common(5)}")
     
     # Check single commits
     single_commits_folder = f"{base_folder}/commit/all"
     if os.path.exists(single_commits_folder):
-        single_commit_files = [f for f in os.listdir(single_commits_folder) if f.endswith('.json')]
         print(f"\n📊 Single Commits:")
-        print(f"   Detailed commits: {len(single_commit_files)}")
+        print(f"   Detailed commits: {count_existing_single_commits(single_commits_folder)}")
 
 def example_data_for_reviewer_system(base_folder: str):
     """Example: Extract data needed for reviewer recommendation"""
@@ -104,13 +106,12 @@ def example_data_for_reviewer_system(base_folder: str):
         # Extract PR data
         pull_requests_file = f"{base_folder}/pull/all_data.json"
         if os.path.exists(pull_requests_file):
-            with open(pull_requests_file, 'r') as f:
-                prs = json.load(f)
+            prs = _load_json(pull_requests_file)
             
             for pr in prs:
                 pr_data = {
                     'number': pr.get('number'),
-                    'author': pr.get('user', {}).get('login'),
+                    'author': (pr.get('user') or _EMPTY).get('login'),
                     'title': pr.get('title'),
                     'files_changed': pr.get('changed_files', 0),
                     'additions': pr.get('additions', 0),
@@ -121,22 +122,26 @@ def example_data_for_reviewer_system(base_folder: str):
                 reviewer_data['pull_requests'].append(pr_data)
         
         # Extract review data (from each PR's reviews)
+        pull_folder = f"{base_folder}/pull"
         for pr in reviewer_data['pull_requests']:
             pr_number = pr['number']
-            reviews_file = f"{base_folder}/pull/{pr_number}/reviews/all_data.json"
+            reviews_file = f"{pull_folder}/{pr_number}/reviews/all_data.json"
             
-            if os.path.exists(reviews_file):
-                with open(reviews_file, 'r') as f:
-                    reviews = json.load(f)
-                
-                for review in reviews:
-                    review_data = {
-                        'pr_number': pr_number,
-                        'reviewer': review.get('user', {}).get('login'),
-                        'state': review.get('state'),  # APPROVED, CHANGES_REQUESTED, etc.
-                        'submitted_at': review.get('submitted_at')
-                    }
-                    reviewer_data['reviews'].append(review_data)
+            # Opening directly costs one syscall less than checking existence first
+            try:
+                with open(reviews_file, 'rb') as f:
+                    reviews = orjson.loads(f.read())
+            except FileNotFoundError:
+                continue
+            
+            for review in reviews:
+                review_data = {
+                    'pr_number': pr_number,
+                    'reviewer': (review.get('user') or _EMPTY).get('login'),
+                    'state': review.get('state'),  # APPROVED, CHANGES_REQUESTED, etc.
+                    'submitted_at': review.get('submitted_at')
+                }
+                reviewer_data['reviews'].append(review_data)
         
         print(f"📊 Extracted data for reviewer recommendation:")
         print(f"   Pull requests: {len(reviewer_data['pull_requests'])}")
@@ -144,8 +149,8 @@ def example_data_for_reviewer_system(base_folder: str):
         
         # Save processed data for reviewer system
         output_file = f"{base_folder}/processed_for_reviewer_system.json"
-        with open(output_file, 'w') as f:
-            json.dump(reviewer_data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(reviewer_data, option=orjson.OPT_INDENT_2))
         
         print(f"💾 Processed data saved to: {output_file}")
         
@@ -211,7 +216,7 @@ if __name__ == "__main__":
         check_environment()
     elif args.examples:
         if check_environment():
-            asyncio.run(run_examples())
+            run_event_loop(run_examples())
     else:
         print("🎯 GitHub Unified Crawler Setup")
         print("Usage:")
@@ -1,11 +1,20 @@
 import asyncio
 import aiohttp
+import orjson
 import logging
-from typing import Dict, Any, Optional, List
+import random
+import re
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+from multidict import CIMultiDict
 from config import config
 from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+from utils import gather_bounded
 from progress_tracker import get_progress_tracker
 
+# Page number of the rel="last" entry in a GitHub Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors"""
     def __init__(self, status_code: int, message: str, response_data: Any = None):
@@ -17,63 +26,123 @@ class GitHubAPIError(Exception):
 class GitHubClient:
     """Async GitHub API client with intelligent rate limiting"""
     
-    def __init__(self):
+    def __init__(self, cache_name: str = 'responses'):
         self.rate_limiter = RateLimiter(config)
+        self.cache_name = cache_name
         self.logger = logging.getLogger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
+        self.response_cache: Optional[ResponseCache] = None
+        
+        # PR dependency counts from GraphQL, keyed by (owner, repo, pull number)
+        self._dependency_counts: Dict[Tuple[str, str, int], Dict[str, Optional[int]]] = {}
+        self._dependency_counts_lock = asyncio.Lock()
         
     async def __aenter__(self):
         """Async context manager entry"""
+        # One pooled, keep-alive connector for the whole crawl so TLS handshakes
+        # are paid once per connection rather than per request
+        connector = aiohttp.TCPConnector(
+            limit=config.connection_pool_size,
+            limit_per_host=config.connection_pool_size,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        # No total timeout, so large responses are bounded by read stalls rather than size
         self.session = aiohttp.ClientSession(
+            connector=connector,
             headers=config.headers,
-            timeout=aiohttp.ClientTimeout(total=30)
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=config.connect_timeout,
+                sock_read=config.read_timeout
+            )
         )
+        
+        if config.response_cache:
+            self.response_cache = ResponseCache(
+                f"{config.cache_dir}/{self.cache_name}.sqlite", config.cache_ttl_seconds
+            )
+            await self.response_cache.open()
+        
+        # Let the progress display read rate limit status when it refreshes
+        try:
+            get_progress_tracker().set_rate_limit_source(self.rate_limiter.get_status_summary)
+        except RuntimeError:
+            pass  # Progress tracker not initialized
+        
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+        if self.response_cache:
+            await self.response_cache.close()
+            self.response_cache = None
     
-    async def make_request(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make a single API request with rate limiting"""
+    def _backoff(self, retry_count: int) -> float:
+        """Exponential backoff with jitter, shared by all requests through the rate limiter"""
+        delay = min(
+            config.base_backoff_delay * (2 ** retry_count),
+            config.max_backoff_delay
+        ) * random.uniform(0.5, 1.5)
+        
+        # Concurrent failures extend one deadline instead of each sleeping on its own
+        self.rate_limiter.block_for(delay)
+        return delay
+    
+    async def make_request(self, url: str, params: Dict[str, Any] = None, raw: bool = False,
+                           with_headers: bool = False, cache: bool = True) -> Any:
+        """Make a single API request with rate limiting (raw=True returns the body bytes unparsed,
+        with_headers=True returns a (body, headers) tuple, cache=False bypasses the response cache)"""
         if not self.session:
             raise RuntimeError("GitHubClient must be used as async context manager")
         
-        # Wait if rate limit requires it
-        await self.rate_limiter.wait_if_needed()
-        
         params = params or {}
         retry_count = 0
         
+        # Revalidate a cached copy instead of downloading it again
+        cache_key = None
+        cached = None
+        if cache and self.response_cache is not None:
+            cache_key = ResponseCache.make_key(url, params)
+            cached = await self.response_cache.get(cache_key)
+        request_headers = {'If-None-Match': cached[0]} if cached else None
+        
         while retry_count < config.max_retries:
             try:
-                # Record the request
-                self.rate_limiter.record_request()
+                # Wait for a token from the rate limiter
+                await self.rate_limiter.acquire()
                 
-                async with self.session.get(url, params=params) as response:
+                async with self.session.get(url, params=params, headers=request_headers) as response:
                     # Update rate limit status from headers
-                    self.rate_limiter.update_from_headers(dict(response.headers))
-                    
-                    # Update progress tracker with rate limit info
-                    try:
-                        progress_tracker = get_progress_tracker()
-                        progress_tracker.update_rate_limit(
-                            self.rate_limiter.get_status_summary()
-                        )
-                    except RuntimeError:
-                        pass  # Progress tracker not initialized yet
+                    self.rate_limiter.update_from_headers(response.headers)
                     
                     if response.status == 200:
-                        return await response.json()
+                        body = await response.read()
+                        headers = response.headers
+                        etag = headers.get('ETag')
+                        if cache_key is not None and etag:
+                            await self.response_cache.put(cache_key, etag, headers.get('Link'), body)
                     
-                    elif response.status == 403:
-                        # Rate limit exceeded
-                        wait_time = self.rate_limiter.handle_rate_limit_error(
-                            dict(response.headers)
-                        )
+                    elif response.status == 304 and cached:
+                        # Unchanged since cached; GitHub doesn't count 304s against the rate limit
+                        _, link, body = cached
+                        self.response_cache.hits += 1
+                        await self.response_cache.touch(cache_key)
+                        headers = CIMultiDict(response.headers)
+                        if link and 'Link' not in headers:
+                            headers['Link'] = link
+                    
+                    elif response.status in (403, 429):
+                        # Rate limit exceeded; secondary limits say how long to back off
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after is not None:
+                            wait_time = float(retry_after)
+                        else:
+                            wait_time = self.rate_limiter.handle_rate_limit_error()
+                        self.rate_limiter.block_for(wait_time)
                         self.logger.warning(f"Rate limited. Waiting {wait_time/60:.1f} minutes")
-                        await asyncio.sleep(wait_time)
                         continue
                     
                     elif response.status == 404:
@@ -86,15 +155,11 @@ class GitHubClient:
                     elif response.status >= 500:
                         # Server error - retry
                         retry_count += 1
-                        delay = min(
-                            config.base_backoff_delay * (2 ** retry_count),
-                            config.max_backoff_delay
-                        )
+                        delay = self._backoff(retry_count)
                         self.logger.warning(
-                            f"Server error {response.status}. Retrying in {delay}s "
+                            f"Server error {response.status}. Retrying in {delay:.0f}s "
                             f"(attempt {retry_count}/{config.max_retries})"
                         )
-                        await asyncio.sleep(delay)
                         continue
                     
                     else:
@@ -105,52 +170,143 @@ class GitHubClient:
                             f"API request failed: {error_text}",
                             error_text
                         )
+                    
+                    if not raw:
+                        body = orjson.loads(body) if body else None
+                    return (body, headers) if with_headers else body
             
             except aiohttp.ClientError as e:
                 retry_count += 1
-                delay = min(
-                    config.base_backoff_delay * (2 ** retry_count),
-                    config.max_backoff_delay
-                )
+                delay = self._backoff(retry_count)
                 self.logger.warning(
-                    f"Network error: {e}. Retrying in {delay}s "
+                    f"Network error: {e}. Retrying in {delay:.0f}s "
                     f"(attempt {retry_count}/{config.max_retries})"
                 )
-                await asyncio.sleep(delay)
         
         # All retries exhausted
         raise GitHubAPIError(500, f"Failed after {config.max_retries} retries")
     
+    async def graphql(self, query: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data (no retries; callers fall back to REST)"""
+        if not self.session:
+            raise RuntimeError("GitHubClient must be used as async context manager")
+        
+        await self.rate_limiter.acquire()
+        
+        payload = {'query': query, 'variables': variables or {}}
+        async with self.session.post(f"{config.base_url}/graphql", json=payload) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise GitHubAPIError(response.status, f"GraphQL request failed: {error_text}", error_text)
+            
+            result = await response.json()
+        
+        if result.get('errors') and not result.get('data'):
+            raise GitHubAPIError(200, f"GraphQL query failed: {result['errors']}", result['errors'])
+        
+        return result.get('data') or {}
+    
+    async def get_pull_dependency_counts(self, repo_owner: str, repo_name: str,
+                                         pull_numbers: Iterable[int]) -> Dict[int, Dict[str, Optional[int]]]:
+        """Get files/reviews/commits totals for many PRs with batched GraphQL queries"""
+        pull_numbers = list(pull_numbers)
+        
+        # Serialized so parallel dependency crawlers share one set of queries
+        async with self._dependency_counts_lock:
+            missing = [
+                number for number in pull_numbers
+                if (repo_owner, repo_name, number) not in self._dependency_counts
+            ]
+            
+            for i in range(0, len(missing), config.graphql_batch_size):
+                batch = missing[i:i + config.graphql_batch_size]
+                fields = ' '.join(
+                    f"pr{number}: pullRequest(number: {number}) "
+                    f"{{ files {{ totalCount }} reviews {{ totalCount }} commits {{ totalCount }} }}"
+                    for number in batch
+                )
+                query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+                
+                try:
+                    data = await self.graphql(query, {'owner': repo_owner, 'name': repo_name})
+                except (GitHubAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.logger.warning(f"Failed to fetch PR dependency counts, using REST: {e}")
+                    continue
+                
+                repository = data.get('repository') or {}
+                for number in batch:
+                    node = repository.get(f"pr{number}")
+                    if not node:
+                        continue
+                    self._dependency_counts[(repo_owner, repo_name, number)] = {
+                        name: (node.get(name) or {}).get('totalCount')
+                        for name in ('files', 'reviews', 'commits')
+                    }
+        
+        return {
+            number: self._dependency_counts[(repo_owner, repo_name, number)]
+            for number in pull_numbers
+            if (repo_owner, repo_name, number) in self._dependency_counts
+        }
+    
+    async def _fetch_page(self, base_url: str, page_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch one page of paginated data (a missing page is empty)"""
+        try:
+            return await self.make_request(base_url, page_params)
+        except GitHubAPIError as e:
+            if e.status_code == 404:
+                return []
+            raise
+    
     async def get_paginated_data(self, base_url: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Fetch all pages of paginated data"""
-        all_data = []
-        page = 1
-        params = params or {}
+        # Built once; only 'page' changes from request to request
+        page_params = {**(params or {}), 'per_page': config.items_per_page, 'page': 1}
+        
+        try:
+            data, headers = await self.make_request(base_url, page_params, with_headers=True)
+        except GitHubAPIError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        
+        if not data:
+            return []
         
+        all_data = data
+        self.logger.debug(f"Fetched page 1, got {len(data)} items")
+        
+        # The Link header names the last page, so the remaining pages can be fetched together
+        match = _LAST_PAGE_RE.search(headers.get('Link', ''))
+        if match:
+            last_page = int(match.group(1))
+            
+            async def fetch(page: int) -> List[Dict[str, Any]]:
+                # Requests are in flight together, so each needs its own params
+                return await self._fetch_page(base_url, {**page_params, 'page': page})
+            
+            # Results come back in page order
+            pages = await gather_bounded(fetch, range(2, last_page + 1), config.max_concurrent_requests)
+            for page_data in pages:
+                all_data.extend(page_data)
+            
+            self.logger.debug(f"Fetched pages 2-{last_page}, {len(all_data)} items in total")
+            return all_data
+        
+        if len(data) < config.items_per_page:
+            return all_data
+        
+        # No Link header; walk the pages until an empty one
+        page = 2
         while True:
-            current_params = {
-                **params,
-                'page': page,
-                'per_page': config.items_per_page
-            }
+            page_params['page'] = page
+            data = await self._fetch_page(base_url, page_params)
+            if not data:
+                break
             
-            try:
-                data = await self.make_request(base_url, current_params)
-                
-                if not data or len(data) == 0:
-                    break
-                
-                all_data.extend(data)
-                page += 1
-                
-                # Log progress
-                self.logger.debug(f"Fetched page {page-1}, got {len(data)} items")
-                
-            except GitHubAPIError as e:
-                if e.status_code == 404:
-                    # No more pages
-                    break
-                raise
+            all_data.extend(data)
+            self.logger.debug(f"Fetched page {page}, got {len(data)} items")
+            page += 1
         
         return all_data
     
@@ -184,13 +340,16 @@ class GitHubClient:
         url = f"{config.base_url}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/comments"
         return await self.get_paginated_data(url)
     
-    async def get_single_commit(self, repo_owner: str, repo_name: str, commit_sha: str) -> Dict[str, Any]:
-        """Get detailed data for a single commit"""
+    async def get_single_commit(self, repo_owner: str, repo_name: str, commit_sha: str,
+                                raw: bool = False) -> Any:
+        """Get detailed data for a single commit (raw=True returns the JSON body as bytes)"""
         url = f"{config.base_url}/repos/{repo_owner}/{repo_name}/commits/{commit_sha}"
-        return await self.make_request(url)
+        # Not cached: the crawler already saves commit details to disk and skips them on resume
+        return await self.make_request(url, raw=raw, cache=False)
     
     async def batch_get_single_commits(self, repo_owner: str, repo_name: str, 
-                                     commit_shas: List[str], batch_size: int = None) -> Dict[str, Dict[str, Any]]:
+                                     commit_shas: List[str], batch_size: int = None,
+                                     raw: bool = False) -> Dict[str, Any]:
         """Get multiple single commits in parallel batches"""
         if batch_size is None:
             batch_size = min(config.max_concurrent_requests, len(commit_shas))
@@ -201,12 +360,9 @@ class GitHubClient:
         for i in range(0, len(commit_shas), batch_size):
             batch = commit_shas[i:i + batch_size]
             
-            # Check if we have enough rate limit for this batch
-            await self.rate_limiter.wait_if_needed(len(batch))
-            
-            # Process batch in parallel
+            # Process batch in parallel (each request waits on the rate limiter)
             tasks = [
-                self.get_single_commit(repo_owner, repo_name, sha)
+                self.get_single_commit(repo_owner, repo_name, sha, raw=raw)
                 for sha in batch
             ]
             
@@ -3,13 +3,14 @@ import asyncio
 import sys
 import os
 from pathlib import Path
+from typing import List
 
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from unified_crawler import crawl_repository
+# The crawler stack (aiohttp, crawlers, utils) is imported where it is used,
+# so --help and --examples don't pay for loading it
 from config import config
-from utils import validate_crawled_data, get_folder_size_mb
 
 def validate_environment():
     """Validate environment and dependencies"""
@@ -27,21 +28,27 @@ def validate_environment():
 
 def print_banner():
     """Print application banner"""
-    print("=" * 80)
-    print("🚀 GitHub Unified Crawler")
-    print("   Complete repository data extraction with intelligent rate limiting")
-    print("=" * 80)
+    lines = [
+        "=" * 80,
+        "🚀 GitHub Unified Crawler",
+        "   Complete repository data extraction with intelligent rate limiting",
+        "=" * 80,
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def print_help_examples():
     """Print usage examples"""
-    print("\n📖 Usage Examples:")
-    print("  python main.py --owner facebook --repo react")
-    print("  python main.py --owner microsoft --repo vscode --no-resume")
-    print("  python main.py --owner tensorflow --repo tensorflow --conservative")
-    print("  python main.py --owner myorg --repo myrepo --validate-only")
+    lines = [
+        "\n📖 Usage Examples:",
+        "  python main.py --owner facebook --repo react",
+        "  python main.py --owner microsoft --repo vscode --no-resume",
+        "  python main.py --owner tensorflow --repo tensorflow --conservative",
+        "  python main.py --owner myorg --repo myrepo --validate-only",
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-async def main():
-    """Main entry point"""
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description="GitHub Unified Crawler - Comprehensive repository data extraction",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -106,17 +113,38 @@ The crawler will fetch:
     )
     
     parser.add_argument(
-        '--examples',
+        '--graphql-counts',
         action='store_true',
-        help='Show usage examples and exit'
+        help='Use batched GraphQL count queries to skip REST calls for PRs with no files/reviews/comments'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Start crawling without asking for confirmation'
+    )
     
-    if args.examples:
-        print_help_examples()
-        return
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the local API response cache'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help=f'Directory for the API response cache (default: {config.cache_dir})'
+    )
     
+    parser.add_argument(
+        '--examples',
+        action='store_true',
+        help='Show usage examples and exit'
+    )
+    
+    return parser.parse_args()
+
+async def main(args: argparse.Namespace):
+    """Main entry point"""
     print_banner()
     validate_environment()
     
@@ -129,6 +157,15 @@ The crawler will fetch:
     if args.max_concurrent:
         config.max_concurrent_requests = args.max_concurrent
     
+    if args.graphql_counts:
+        config.graphql_dependency_counts = True
+    
+    if args.no_cache:
+        config.response_cache = False
+    
+    if args.cache_dir:
+        config.cache_dir = args.cache_dir
+    
     # Validation only mode
     if args.validate_only:
         await validate_only_mode(args.owner, args.repo)
@@ -140,14 +177,19 @@ The crawler will fetch:
     print(f"⚡ Max concurrent requests: {config.max_concurrent_requests}")
     print(f"🛡️  Rate limit buffer: {config.rate_limit_buffer}")
     
-    # Ask for confirmation for large repositories
-    response = input("\nProceed with crawling? [Y/n]: ").strip().lower()
-    if response in ['n', 'no']:
-        print("Crawling cancelled.")
-        return
+    # Ask for confirmation for large repositories (read off the event loop thread)
+    if not args.yes:
+        response = await asyncio.get_running_loop().run_in_executor(
+            None, input, "\nProceed with crawling? [Y/n]: "
+        )
+        if response.strip().lower() in ('n', 'no'):
+            print("Crawling cancelled.")
+            return
     
     print("\n🚀 Starting unified crawl...\n")
     
+    from unified_crawler import crawl_repository
+    
     try:
         # Run the unified crawler
         summary = await crawl_repository(
@@ -179,16 +221,17 @@ async def validate_only_mode(owner: str, repo: str):
         print(f"❌ No data found at {base_folder}")
         return
     
+    from utils import validate_crawled_data
+    
     # Run validation
     results = validate_crawled_data(base_folder)
     
     if results['valid']:
         print("✅ Data validation passed!")
-        folder_size = get_folder_size_mb(base_folder)
-        print(f"📊 Data size: {folder_size:.1f} MB")
+        stats = results.get('stats', {})
+        print(f"📊 Data size: {stats.get('data_size_mb', 0.0):.1f} MB")
         
         # Print comprehensive stats
-        stats = results.get('stats', {})
         analysis = results.get('analysis', {})
 
         # Core data counts
@@ -230,53 +273,67 @@ async def validate_only_mode(owner: str, repo: str):
 
 def print_final_summary(summary):
     """Print final crawling summary"""
-    print("\n" + "=" * 80)
-    print("🎉 CRAWLING COMPLETED!")
-    print("=" * 80)
+    # Built up and written once, so it can't interleave with trailing display output
+    lines: List[str] = []
+    owner, repo = summary['repository'].split('/')
+    
+    lines.append("\n" + "=" * 80)
+    lines.append("🎉 CRAWLING COMPLETED!")
+    lines.append("=" * 80)
     
-    print(f"📁 Repository: {summary['repository']}")
-    print(f"💾 Data Location: {summary['base_folder']}")
-    print(f"📊 Total Data Size: {summary['data_size_mb']:.1f} MB")
+    lines.append(f"📁 Repository: {summary['repository']}")
+    lines.append(f"💾 Data Location: {summary['base_folder']}")
+    lines.append(f"📊 Total Data Size: {summary['data_size_mb']:.1f} MB")
     
     # Print crawler details if available
     checkpoint_summary = summary.get('checkpoint_summary', {})
     crawler_details = checkpoint_summary.get('crawler_details', {})
     
     if crawler_details:
-        print(f"\n📈 Crawler Summary:")
+        lines.append(f"\n📈 Crawler Summary:")
         for crawler_name, details in crawler_details.items():
             status = "✅" if details['completed'] else "❌"
-            print(f"   {status} {crawler_name.replace('_', ' ').title()}: {details['progress']}")
+            lines.append(f"   {status} {crawler_name.replace('_', ' ').title()}: {details['progress']}")
             if details['failed_count'] > 0:
-                print(f"      ⚠️ Failed items: {details['failed_count']}")
+                lines.append(f"      ⚠️ Failed items: {details['failed_count']}")
     
     # Run quick validation and show quality metrics
     try:
+        from utils import validate_crawled_data
         validation_results = validate_crawled_data(summary['base_folder'])
         if validation_results.get('analysis', {}).get('quality'):
             quality = validation_results['analysis']['quality']
-            print(f"\n📈 Data Quality Assessment:")
-            print(f"   Quality Score: {quality.get('overall_score', 0)}/100")
-            print(f"   Reviewer Recommendation Suitability: {quality.get('suitability_for_reviewer_recommendation', 'unknown').title()}")
+            lines.append(f"\n📈 Data Quality Assessment:")
+            lines.append(f"   Quality Score: {quality.get('overall_score', 0)}/100")
+            lines.append(f"   Reviewer Recommendation Suitability: {quality.get('suitability_for_reviewer_recommendation', 'unknown').title()}")
             
             stats = validation_results.get('stats', {})
             review_coverage = stats.get('reviews_coverage_percentage', 0)
             if review_coverage > 0:
-                print(f"   Review Coverage: {review_coverage:.1f}%")
+                lines.append(f"   Review Coverage: {review_coverage:.1f}%")
     except Exception:
         pass  # Skip quality assessment if validation fails
     
-    print(f"\n🎯 Next Steps:")
-    print(f"   1. Your data is ready in: {summary['base_folder']}")
-    print(f"   2. Run quality analysis: python data_quality_analyzer.py {summary['base_folder']}")
-    print(f"   3. Use this path in your reviewer recommendation system")
-    print(f"   4. Run validation: python main.py --owner {summary['repository'].split('/')[0]} --repo {summary['repository'].split('/')[1]} --validate-only")
+    lines.append(f"\n🎯 Next Steps:")
+    lines.append(f"   1. Your data is ready in: {summary['base_folder']}")
+    lines.append(f"   2. Run quality analysis: python data_quality_analyzer.py {summary['base_folder']}")
+    lines.append(f"   3. Use this path in your reviewer recommendation system")
+    lines.append(f"   4. Run validation: python main.py --owner {owner} --repo {repo} --validate-only")
     
-    print("=" * 80)
+    lines.append("=" * 80)
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.examples:
+        print_help_examples()
+        sys.exit(0)
+    
+    from crawlers import run_event_loop
     try:
-        asyncio.run(main())
+        run_event_loop(main(args))
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
         sys.exit(0)
\ No newline at end of file
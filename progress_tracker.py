@@ -3,43 +3,125 @@ import sys
 import time
 import threading
 import os
+import functools
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
 
-@dataclass
+# Every fill level of the default 40-column progress bar, built once
+_BAR_WIDTH = 40
+_BARS = tuple('[' + '#' * filled + '-' * (_BAR_WIDTH - filled) + ']' for filled in range(_BAR_WIDTH + 1))
+
+# ETAs are rounded up to 5 second steps so repeated frames reuse cached strings
+_ETA_STEP = 5
+
+# Recent (time, completed) samples kept per crawler for the running rate, at most one per second
+_RATE_WINDOW_SAMPLES = 64
+_RATE_SAMPLE_INTERVAL = 1.0
+
+# Seconds between progress lines when stdout is not a terminal
+_LOG_INTERVAL = 30.0
+
+# Idle repaint interval for interactive terminals, and the minimum gap between frames
+_DISPLAY_INTERVAL = 4.0
+_MIN_FRAME_GAP = 0.5
+
+# Per-crawler row templates, bound once rather than re-parsed as f-strings each frame
+_PROGRESS_ROW = "   Progress: {:,}/{:,} (Failed: {}, Skipped: {})".format
+_RATE_ROW = "   Rate: {:.1f}/min | Duration: {} | ETA: {}".format
+
+# Home the cursor and erase to the end of the screen, leaving scrollback alone
+_CLEAR_SCREEN = '\033[H\033[J'
+
+# Frame pieces: home the cursor, end each row by erasing the rest of the line,
+# then erase whatever is left below the block
+_CURSOR_HOME = '\033[H'
+_ROW_END = '\033[K\n'
+_ERASE_BELOW = '\033[J'
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_dur(seconds: int) -> str:
+    """Format whole seconds in human readable format"""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        return f"{seconds/60:.1f}m"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}h {minutes}m"
+
+def _enable_windows_ansi() -> None:
+    """Turn on escape sequence handling for the Windows console behind stdout"""
+    import ctypes
+    from ctypes import wintypes
+    
+    ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = wintypes.DWORD()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+
+@functools.lru_cache(maxsize=1024)
+def _progress_bar(tenths: int, width: int) -> str:
+    """Build the bar for a percentage given in tenths, so it only changes with the shown digit"""
+    percentage = tenths / 10
+    filled = int(width * percentage / 100)
+    if width == _BAR_WIDTH and 0 <= filled <= _BAR_WIDTH:
+        return f'{_BARS[filled]} {percentage:5.1f}%'
+    bar = '#' * filled + '-' * (width - filled)
+    return f'[{bar}] {percentage:5.1f}%'
+
+@dataclass(slots=True)
 class CrawlerStats:
     """Statistics for a specific crawler"""
     total: int = 0
     completed: int = 0
     failed: int = 0
     skipped: int = 0
+    
+    # time.monotonic() readings, so wall clock adjustments don't skew durations
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     
-    @property
-    def progress_percentage(self) -> float:
-        if self.total == 0:
-            return 0.0
-        return (self.completed / self.total) * 100
+    # Derived values, refreshed by recompute() rather than on every read
+    progress_percentage: float = 0.0
+    is_complete: bool = False
+    duration: float = 0.0
+    rate_per_minute: float = 0.0
     
-    @property
-    def is_complete(self) -> bool:
-        return self.completed >= self.total and self.total > 0
+    # Guards this crawler's counts, so updates to different crawlers don't contend
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # Rolling window of (time, completed) samples, so the running rate follows recent throughput
+    samples: Deque[Tuple[float, int]] = field(
+        default_factory=lambda: deque(maxlen=_RATE_WINDOW_SAMPLES), repr=False, compare=False
+    )
     
-    @property
-    def duration(self) -> float:
+    def recompute(self, now: float):
+        """Refresh the derived values after a count change or clock tick"""
+        total = self.total
+        completed = self.completed
+        self.progress_percentage = (completed / total) * 100 if total else 0.0
+        self.is_complete = completed >= total and total > 0
+        
         if self.start_time is None:
-            return 0.0
-        end = self.end_time or time.time()
-        return end - self.start_time
-    
-    @property
-    def rate_per_minute(self) -> float:
-        if self.duration == 0:
-            return 0.0
-        return (self.completed / self.duration) * 60
+            self.duration = 0.0
+        else:
+            self.duration = (self.end_time or now) - self.start_time
+        
+        samples = self.samples
+        if not samples or now - samples[-1][0] >= _RATE_SAMPLE_INTERVAL:
+            samples.append((now, completed))
+        
+        # While running, project from the window; once finished, report the lifetime average
+        if self.end_time is None and len(samples) > 1:
+            window_start, window_completed = samples[0]
+            span = now - window_start
+            self.rate_per_minute = ((completed - window_completed) / span) * 60 if span else 0.0
+        else:
+            self.rate_per_minute = (completed / self.duration) * 60 if self.duration else 0.0
 
 class ProgressTracker:
     """Real-time progress tracker with proper display control"""
@@ -47,10 +129,11 @@ class ProgressTracker:
     def __init__(self, repo_owner: str, repo_name: str):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
-        self.start_time = time.time()
-        self.stats: Dict[str, CrawlerStats] = defaultdict(CrawlerStats)
+        self.start_time = time.monotonic()
+        # Crawlers must be registered with init_crawler before any update (KeyError otherwise)
+        self.stats: Dict[str, CrawlerStats] = {}
         self.current_operation = "Initializing..."
-        self.rate_limit_status = {}
+        self.rate_limit_source: Optional[Callable[[], Dict[str, Any]]] = None
         self.display_task = None
         self.is_running = False
         
@@ -59,6 +142,19 @@ class ProgressTracker:
         self._last_display_time = 0
         self._display_active = False
         self._is_interactive = sys.stdout.isatty()
+        if self._is_interactive and os.name == 'nt':
+            # Windows 10+ consoles render ANSI once VT processing is on, so no cls subprocess
+            _enable_windows_ansi()
+        
+        # Last rendered rows per crawler and for the rate limit, keyed by the values shown
+        self._row_cache: Dict[str, Tuple[tuple, List[str]]] = {}
+        self._rate_limit_cache: Optional[Tuple[tuple, List[str]]] = None
+        # Set by progress updates so the display refreshes promptly instead of polling
+        self._dirty = asyncio.Event()
+        # Running sums over all crawlers, adjusted on every update instead of re-summed per frame
+        self._total_items = 0
+        self._completed_items = 0
+        self._failed_items = 0
         
     async def start_display(self):
         """Start the real-time display task"""
@@ -92,209 +188,269 @@ class ProgressTracker:
         """Update current operation description"""
         with self._lock:
             self.current_operation = operation
+        self._dirty.set()
     
     def init_crawler(self, crawler_name: str, total_items: int):
         """Initialize stats for a crawler"""
         with self._lock:
             # Reset or create stats
-            self.stats[crawler_name] = CrawlerStats(
-                total=total_items,
-                start_time=time.time()
-            )
+            now = time.monotonic()
+            stats = CrawlerStats(total=total_items, start_time=now)
+            stats.recompute(now)
+            
+            previous = self.stats.get(crawler_name)
+            if previous is not None:
+                self._total_items -= previous.total
+                self._completed_items -= previous.completed
+                self._failed_items -= previous.failed
+            self._total_items += total_items
+            self.stats[crawler_name] = stats
+        self._dirty.set()
     
     def update_crawler_progress(self, crawler_name: str, completed: int = None, 
                               failed: int = None, skipped: int = None):
         """Update crawler progress with absolute values"""
-        with self._lock:
-            stats = self.stats[crawler_name]
+        stats = self.stats[crawler_name]
+        with stats.lock:
             if completed is not None:
+                self._completed_items += completed - stats.completed
                 stats.completed = completed
             if failed is not None:
+                self._failed_items += failed - stats.failed
                 stats.failed = failed
             if skipped is not None:
                 stats.skipped = skipped
+            stats.recompute(time.monotonic())
+        self._dirty.set()
     
     def increment_crawler_progress(self, crawler_name: str, 
                                  completed: int = 0, failed: int = 0, skipped: int = 0):
         """Increment crawler progress"""
-        with self._lock:
-            stats = self.stats[crawler_name]
-            stats.completed += completed
-            stats.failed += failed
-            stats.skipped += skipped
+        # Crawlers flush their counts from the event loop thread, so the adds never
+        # race and the display tolerates reading them mid-update; no lock is taken
+        stats = self.stats[crawler_name]
+        stats.completed += completed
+        stats.failed += failed
+        stats.skipped += skipped
+        self._completed_items += completed
+        self._failed_items += failed
+        stats.recompute(time.monotonic())
+        self._dirty.set()
     
     def complete_crawler(self, crawler_name: str):
         """Mark crawler as complete"""
-        with self._lock:
-            stats = self.stats[crawler_name]
-            stats.end_time = time.time()
+        stats = self.stats[crawler_name]
+        with stats.lock:
+            stats.end_time = time.monotonic()
             # Ensure completed equals total when marking complete
             if stats.total > 0 and stats.completed < stats.total:
+                self._completed_items += stats.total - stats.completed
                 stats.completed = stats.total
+            stats.recompute(stats.end_time)
+        self._dirty.set()
     
-    def update_rate_limit(self, rate_limit_status: Dict[str, Any]):
-        """Update rate limit status"""
+    def set_rate_limit_source(self, source: Callable[[], Dict[str, Any]]):
+        """Set the callable polled for rate limit status on each display refresh"""
         with self._lock:
-            self.rate_limit_status = rate_limit_status
+            self.rate_limit_source = source
     
-    def _create_progress_bar(self, percentage: float, width: int = 40) -> str:
+    def _create_progress_bar(self, percentage: float, width: int = _BAR_WIDTH) -> str:
         """Create ASCII progress bar"""
-        filled = int(width * percentage / 100)
-        bar = '#' * filled + '-' * (width - filled)
-        return f'[{bar}] {percentage:5.1f}%'
+        return _progress_bar(round(percentage * 10), width)
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human readable format"""
-        if seconds < 60:
-            return f"{seconds:.0f}s"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f}m"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        return _fmt_dur(int(seconds))
     
     def _format_eta(self, stats: CrawlerStats) -> str:
         """Calculate and format ETA"""
         if stats.completed == 0 or stats.is_complete:
             return "Done"
         
+        # Rates from under a second of work are too noisy to project from
         rate = stats.rate_per_minute
-        if rate == 0:
+        if stats.duration < 1.0 or rate == 0:
             return "Calculating..."
         
         remaining = stats.total - stats.completed
-        eta_minutes = remaining / rate
-        eta_seconds = eta_minutes * 60
+        eta_seconds = int(remaining * 60 / rate)
         
-        return self._format_duration(eta_seconds)
+        return _fmt_dur(eta_seconds - eta_seconds % _ETA_STEP + _ETA_STEP)
     
     async def _display_loop(self):
         """Main display loop for interactive terminals"""
         while self.is_running:
             try:
-                current_time = time.time()
+                # Idle frames stay on the 4s cadence; a progress change pulls the next one earlier
+                timeout = max(0.1, _DISPLAY_INTERVAL - (time.monotonic() - self._last_display_time))
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._dirty.clear()
                 
-                # Update display every 4 seconds to reduce flicker
-                if current_time - self._last_display_time >= 4.0:
-                    with self._lock:
-                        if not self._display_active:
-                            self._display_active = True
-                            try:
-                                self._safe_display_update()
-                                self._last_display_time = current_time
-                            finally:
-                                self._display_active = False
+                with self._lock:
+                    if not self._display_active:
+                        self._display_active = True
+                        try:
+                            # One clock read per frame, shared by every crawler row
+                            now = time.monotonic()
+                            self._safe_display_update(now)
+                            self._last_display_time = now
+                        finally:
+                            self._display_active = False
                 
-                await asyncio.sleep(1.0)
+                # At most two frames per second however often progress changes
+                await asyncio.sleep(_MIN_FRAME_GAP)
                 
             except asyncio.CancelledError:
                 break
             except Exception:
                 # Silent failure for display issues, but continue
-                await asyncio.sleep(4.0)
+                await asyncio.sleep(_DISPLAY_INTERVAL)
     
     async def _log_progress_loop(self):
         """Progress logging for non-interactive terminals"""
         while self.is_running:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Log progress every 30 seconds for non-interactive
-                if current_time - self._last_display_time >= 30.0:
+                if current_time - self._last_display_time >= _LOG_INTERVAL:
                     with self._lock:
-                        self._log_progress_summary()
+                        self._log_progress_summary(current_time)
                         self._last_display_time = current_time
                 
-                await asyncio.sleep(5.0)
+                # Sleep straight through to the next log line rather than polling
+                await asyncio.sleep(max(0.1, _LOG_INTERVAL - (time.monotonic() - self._last_display_time)))
                 
             except asyncio.CancelledError:
                 break
             except Exception:
                 await asyncio.sleep(10.0)
     
-    def _safe_display_update(self):
-        """Safe display update with proper terminal handling"""
-        # Clear screen using the most reliable method
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/Mac
-            # Use ANSI escape sequences
-            print('\033[2J\033[H', end='', flush=True)
+    def _safe_display_update(self, now: float):
+        """Redraw the whole status block from the top with one terminal write"""
+        # Repainting every row (not just changed ones) recovers the display after
+        # log lines or a resize scroll the screen; each row erases its old tail
+        lines = self._render_lines(now)
+        self._write_frame(_CURSOR_HOME + _ROW_END.join(lines) + _ROW_END + _ERASE_BELOW)
+    
+    def _write_frame(self, text: str):
+        """Write a frame straight to the terminal's file descriptor"""
+        if os.name == 'nt':  # Windows consoles need the text layer's encoding handling
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        
+        # Flush anything already buffered so it stays ahead of the frame
+        sys.stdout.flush()
+        payload = text.encode('utf-8')
+        fd = sys.stdout.fileno()
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    
+    def _rate_limit_lines(self, rl: Dict[str, Any]) -> List[str]:
+        """Rate limit status lines, rebuilt only when the reported values change"""
+        key = (rl['remaining'], rl['limit'], rl['reset_time'], rl['usage_percentage'],
+               rl.get('conservative_mode', False))
+        if self._rate_limit_cache is not None and self._rate_limit_cache[0] == key:
+            return self._rate_limit_cache[1]
+        
+        if rl['remaining'] > 1000:
+            status = "GOOD"
+        elif rl['remaining'] > 200:
+            status = "WARN"
+        else:
+            status = "CRITICAL"
+        
+        rl_lines = [f"Rate Limit [{status}]: {rl['remaining']}/{rl['limit']} "
+                    f"(Reset: {rl['reset_time']}) - {rl['usage_percentage']:.1f}% used"]
+        if rl.get('conservative_mode', False):
+            rl_lines.append("Conservative mode enabled")
         
-        self._display_status()
+        self._rate_limit_cache = (key, rl_lines)
+        return rl_lines
     
-    def _display_status(self):
-        """Display current crawling status"""
-        total_duration = time.time() - self.start_time
+    def _crawler_lines(self, crawler_name: str, stats: CrawlerStats) -> List[str]:
+        """Status, bar and count lines for a crawler, rebuilt only when its counts move"""
+        key = (stats.total, stats.completed, stats.failed, stats.skipped, stats.is_complete)
+        cached = self._row_cache.get(crawler_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        if stats.is_complete:
+            status = "COMPLETE"
+        elif stats.completed > 0:
+            status = "RUNNING"
+        else:
+            status = "WAITING"
         
-        print("=" * 80)
-        print(f"GitHub Crawler - {self.repo_owner}/{self.repo_name}")
-        print(f"Total Runtime: {self._format_duration(total_duration)}")
-        print(f"Current: {self.current_operation}")
-        print("=" * 80)
+        rows = [
+            f"[{status}] {crawler_name.replace('_', ' ').title()}",
+            f"   {self._create_progress_bar(stats.progress_percentage)}",
+            _PROGRESS_ROW(stats.completed, stats.total, stats.failed, stats.skipped),
+        ]
+        self._row_cache[crawler_name] = (key, rows)
+        return rows
+    
+    def _aggregate_stats(self) -> Tuple[int, int, int]:
+        """(total, completed, failed) summed over all crawlers"""
+        return self._total_items, self._completed_items, self._failed_items
+    
+    def _render_lines(self, now: float) -> List[str]:
+        """Build the status screen as of now, as a list of lines"""
+        total_duration = now - self.start_time
+        lines = []
+        
+        lines.append("=" * 80)
+        lines.append(f"GitHub Crawler - {self.repo_owner}/{self.repo_name}")
+        lines.append(f"Total Runtime: {self._format_duration(total_duration)}")
+        lines.append(f"Current: {self.current_operation}")
+        lines.append("=" * 80)
         
         # Rate limit status
-        if self.rate_limit_status:
-            rl = self.rate_limit_status
-            if rl['remaining'] > 1000:
-                status = "GOOD"
-            elif rl['remaining'] > 200:
-                status = "WARN"
-            else:
-                status = "CRITICAL"
-                
-            print(f"Rate Limit [{status}]: {rl['remaining']}/{rl['limit']} "
-                  f"(Reset: {rl['reset_time']}) - {rl['usage_percentage']:.1f}% used")
-            
-            if rl.get('conservative_mode', False):
-                print("Conservative mode enabled")
+        rl = self.rate_limit_source() if self.rate_limit_source else None
+        if rl:
+            lines.extend(self._rate_limit_lines(rl))
         
-        print()
+        lines.append("")
         
         # Crawler progress
         for crawler_name, stats in self.stats.items():
             if stats.total == 0:
                 continue
-                
-            if stats.is_complete:
-                status = "COMPLETE"
-            elif stats.completed > 0:
-                status = "RUNNING"
-            else:
-                status = "WAITING"
-                
-            progress_bar = self._create_progress_bar(stats.progress_percentage)
             
-            print(f"[{status}] {crawler_name.replace('_', ' ').title()}")
-            print(f"   {progress_bar}")
-            print(f"   Progress: {stats.completed:,}/{stats.total:,} "
-                  f"(Failed: {stats.failed}, Skipped: {stats.skipped})")
+            # Duration and rate move with the clock while a crawler runs
+            if stats.end_time is None:
+                with stats.lock:
+                    stats.recompute(now)
+                
+            lines.extend(self._crawler_lines(crawler_name, stats))
             
             if stats.completed > 0:
-                print(f"   Rate: {stats.rate_per_minute:.1f}/min | "
-                      f"Duration: {self._format_duration(stats.duration)} | "
-                      f"ETA: {self._format_eta(stats)}")
-            print()
+                lines.append(_RATE_ROW(stats.rate_per_minute, self._format_duration(stats.duration),
+                                       self._format_eta(stats)))
+            lines.append("")
         
         # Overall progress
-        total_items = sum(stats.total for stats in self.stats.values())
-        completed_items = sum(stats.completed for stats in self.stats.values())
+        total_items, completed_items, _ = self._aggregate_stats()
         
         if total_items > 0:
             overall_percentage = (completed_items / total_items) * 100
             overall_bar = self._create_progress_bar(overall_percentage)
-            print(f"Overall Progress: {overall_bar}")
-            print(f"   {completed_items:,}/{total_items:,} total items")
+            lines.append(f"Overall Progress: {overall_bar}")
+            lines.append(f"   {completed_items:,}/{total_items:,} total items")
         
-        print("=" * 80)
-        print("Press Ctrl+C to stop gracefully")
+        lines.append("=" * 80)
+        lines.append("Press Ctrl+C to stop gracefully")
+        
+        return lines
     
-    def _log_progress_summary(self):
+    def _log_progress_summary(self, now: float):
         """Log progress summary for non-interactive terminals"""
-        total_duration = time.time() - self.start_time
-        total_items = sum(stats.total for stats in self.stats.values())
-        completed_items = sum(stats.completed for stats in self.stats.values())
+        total_duration = now - self.start_time
+        total_items, completed_items, _ = self._aggregate_stats()
         
         if total_items > 0:
             overall_percentage = (completed_items / total_items) * 100
@@ -303,52 +459,54 @@ class ProgressTracker:
     
     def _final_display(self):
         """Display final summary for interactive terminals"""
-        # Clear screen one last time
-        if os.name == 'nt':
-            os.system('cls')
-        else:
-            print('\033[2J\033[H', end='', flush=True)
-            
-        self._display_final_summary()
+        # Clear screen one last time, in the same write as the summary
+        self._write_frame(_CLEAR_SCREEN + '\n'.join(self._final_summary_lines()) + '\n')
     
     def _log_final_summary(self):
         """Log final summary for non-interactive terminals"""
-        print("\n" + "=" * 80)
-        print("CRAWLING COMPLETED")
-        print("=" * 80)
-        self._display_final_summary()
+        lines = ["", "=" * 80, "CRAWLING COMPLETED", "=" * 80]
+        lines.extend(self._final_summary_lines())
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
-    def _display_final_summary(self):
-        """Common final summary display"""
-        total_duration = time.time() - self.start_time
+    def _final_summary_lines(self) -> List[str]:
+        """Common final summary display, as a list of lines"""
+        now = time.monotonic()
+        total_duration = now - self.start_time
+        lines = []
         
-        print(f"GitHub Crawler Complete - {self.repo_owner}/{self.repo_name}")
-        print(f"Total Duration: {self._format_duration(total_duration)}")
-        print("=" * 80)
+        lines.append(f"GitHub Crawler Complete - {self.repo_owner}/{self.repo_name}")
+        lines.append(f"Total Duration: {self._format_duration(total_duration)}")
+        lines.append("=" * 80)
         
         for crawler_name, stats in self.stats.items():
             if stats.total == 0:
                 continue
+            
+            if stats.end_time is None:
+                with stats.lock:
+                    stats.recompute(now)
                 
             status = "Complete" if stats.is_complete else "Incomplete"
-            print(f"[{status}] {crawler_name.replace('_', ' ').title()}")
-            print(f"   Items: {stats.completed:,}/{stats.total:,} "
-                  f"(Failed: {stats.failed}, Skipped: {stats.skipped})")
-            print(f"   Duration: {self._format_duration(stats.duration)}")
+            lines.append(f"[{status}] {crawler_name.replace('_', ' ').title()}")
+            lines.append(f"   Items: {stats.completed:,}/{stats.total:,} "
+                         f"(Failed: {stats.failed}, Skipped: {stats.skipped})")
+            lines.append(f"   Duration: {self._format_duration(stats.duration)}")
             if stats.duration > 0:
-                print(f"   Average Rate: {stats.rate_per_minute:.1f} items/min")
-            print()
+                lines.append(f"   Average Rate: {stats.rate_per_minute:.1f} items/min")
+            lines.append("")
         
         # Final stats
-        total_items = sum(stats.completed for stats in self.stats.values())
-        total_failed = sum(stats.failed for stats in self.stats.values())
+        _, total_items, total_failed = self._aggregate_stats()
         
-        print(f"Final Summary:")
-        print(f"   Total Items Crawled: {total_items:,}")
-        print(f"   Total Failed: {total_failed:,}")
+        lines.append(f"Final Summary:")
+        lines.append(f"   Total Items Crawled: {total_items:,}")
+        lines.append(f"   Total Failed: {total_failed:,}")
         if total_duration > 0:
-            print(f"   Average Rate: {total_items / (total_duration / 60):.1f} items/min")
-        print("=" * 80)
+            lines.append(f"   Average Rate: {total_items / (total_duration / 60):.1f} items/min")
+        lines.append("=" * 80)
+        
+        return lines
 
 # Singleton progress tracker
 _progress_tracker: Optional[ProgressTracker] = None
@@ -1,11 +1,12 @@
 import asyncio
 import time
 import logging
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitStatus:
     """GitHub API rate limit status"""
     limit: int = 5000
@@ -32,17 +33,32 @@ class RateLimiter:
         self.config = config
         self.status = RateLimitStatus()
         self.logger = logging.getLogger(__name__)
-        self.request_times = []  # Track request timing
         self.consecutive_failures = 0
         self.conservative_mode = False
         
-    def update_from_headers(self, headers: Dict[str, str]) -> None:
-        """Update rate limit status from response headers"""
+        # Token bucket: refills at the rate the remaining quota allows until reset,
+        # with bursts capped at the concurrency limit
+        self.capacity = float(config.max_concurrent_requests)
+        self.rate = config.max_requests_per_hour / 3600
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0  # monotonic deadline from Retry-After
+        self._lock = asyncio.Lock()
+        
+        # Last status summary handed to the display, and the values it was built from
+        self._summary: Dict[str, Any] = {}
+        self._summary_key: Optional[tuple] = None
+        
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Update rate limit status from response headers (read in place, no copy needed)"""
         try:
             self.status.limit = int(headers.get('X-RateLimit-Limit', 5000))
             self.status.remaining = int(headers.get('X-RateLimit-Remaining', 5000))
-            self.status.reset_time = int(headers.get('X-RateLimit-Reset', time.time() + 3600))
+            # Only read the clock when the header is missing, not on every response
+            reset = headers.get('X-RateLimit-Reset')
+            self.status.reset_time = int(reset) if reset is not None else int(time.time() + 3600)
             self.status.used = int(headers.get('X-RateLimit-Used', 0))
+            self._update_rate()
             
             # Reset consecutive failures on successful rate limit update
             self.consecutive_failures = 0
@@ -60,67 +76,55 @@ class RateLimiter:
             
         return self.status.remaining > (upcoming_requests + buffer)
     
-    def calculate_delay(self, upcoming_requests: int = 1) -> float:
-        """Calculate appropriate delay before next request"""
-        
-        # If we're safe, minimal delay
-        if self.is_safe_to_proceed(upcoming_requests):
-            return self._calculate_minimal_delay()
-        
-        # If rate limit exhausted, wait for reset
-        if self.status.is_exhausted:
-            return self.status.seconds_until_reset + 60  # 1 minute buffer
-        
-        # If approaching limit, calculate proportional delay
-        remaining_time = self.status.seconds_until_reset
-        requests_needed = upcoming_requests + self.config.rate_limit_buffer
-        
-        if requests_needed >= self.status.remaining:
-            # Not enough requests left, wait for reset
-            return remaining_time + 60
-        
-        # Spread remaining requests over remaining time
-        return max(0.5, remaining_time / self.status.remaining)
-    
-    def _calculate_minimal_delay(self) -> float:
-        """Calculate minimal delay to avoid overwhelming API"""
-        # Clean old request times (keep last minute)
-        current_time = time.time()
-        self.request_times = [
-            req_time for req_time in self.request_times 
-            if current_time - req_time < 60
-        ]
+    def _update_rate(self) -> None:
+        """Spread the usable remaining quota evenly over the time until reset"""
+        buffer = self.config.rate_limit_buffer
+        if self.conservative_mode:
+            buffer *= 2
         
-        # If too many requests in last minute, slow down
-        if len(self.request_times) > 60:  # More than 1 per second
-            return 1.0
-        elif len(self.request_times) > 30:  # More than 0.5 per second
-            return 0.5
-        else:
-            return 0.1  # Minimal delay
+        usable = self.status.remaining - buffer
+        self.rate = max(usable, 0) / max(self.status.seconds_until_reset, 1.0)
     
-    async def wait_if_needed(self, upcoming_requests: int = 1) -> None:
-        """Wait if necessary before making request"""
-        delay = self.calculate_delay(upcoming_requests)
-        
-        if delay > 60:  # Long delay, inform user
-            reset_time = self.status.reset_datetime.strftime('%H:%M:%S')
-            self.logger.info(
-                f"Rate limit approaching. Waiting {delay/60:.1f} minutes "
-                f"(resets at {reset_time})"
-            )
-        
-        if delay > 0:
-            await asyncio.sleep(delay)
+    def block_for(self, seconds: float) -> None:
+        """Hold all requests for the given number of seconds (e.g. Retry-After)"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
     
-    def record_request(self) -> None:
-        """Record that a request was made"""
-        self.request_times.append(time.time())
+    async def acquire(self) -> None:
+        """Wait until a request token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                if self.rate > 0:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    continue
+                
+                # Quota used up: wait for the reset, then assume a fresh window
+                # until the next response headers report the real one
+                delay = self.status.seconds_until_reset + 60  # 1 minute buffer
+                reset_time = self._format_reset_time(self.status.reset_time)
+                self.logger.info(
+                    f"Rate limit exhausted. Waiting {delay/60:.1f} minutes "
+                    f"(resets at {reset_time})"
+                )
+                await asyncio.sleep(delay)
+                
+                self.status.remaining = self.status.limit
+                self.status.reset_time = int(time.time() + 3600)
+                self._update_rate()
     
-    def handle_rate_limit_error(self, response_headers: Dict[str, str]) -> float:
-        """Handle 403 rate limit exceeded response"""
+    def handle_rate_limit_error(self) -> float:
+        """Handle 403 rate limit exceeded response (status already updated from its headers)"""
         self.consecutive_failures += 1
-        self.update_from_headers(response_headers)
         
         # Enable conservative mode after multiple failures
         if self.consecutive_failures >= 3:
@@ -134,12 +138,29 @@ class RateLimiter:
         return wait_time
     
     def get_status_summary(self) -> Dict[str, Any]:
-        """Get current rate limit status for display"""
-        return {
-            'remaining': self.status.remaining,
-            'limit': self.status.limit,
-            'reset_time': self.status.reset_datetime.strftime('%H:%M:%S'),
-            'seconds_until_reset': int(self.status.seconds_until_reset),
-            'conservative_mode': self.conservative_mode,
-            'usage_percentage': ((self.status.limit - self.status.remaining) / self.status.limit) * 100
-        }
\ No newline at end of file
+        """Get current rate limit status for display (empty until headers are seen)"""
+        status = self.status
+        if not status.reset_time:
+            return {}
+        
+        # Rebuilt only when the status moves; the display polls this every frame
+        key = (status.remaining, status.limit, status.reset_time, self.conservative_mode)
+        if key != self._summary_key:
+            self._summary_key = key
+            self._summary = {
+                'remaining': status.remaining,
+                'limit': status.limit,
+                'reset_time': self._format_reset_time(status.reset_time),
+                'seconds_until_reset': 0,
+                'conservative_mode': self.conservative_mode,
+                'usage_percentage': ((status.limit - status.remaining) / status.limit) * 100
+            }
+        
+        self._summary['seconds_until_reset'] = int(status.seconds_until_reset)
+        return self._summary
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _format_reset_time(reset_time: int) -> str:
+        """Format a reset timestamp as local HH:MM:SS (it only changes once per window)"""
+        return datetime.fromtimestamp(reset_time).strftime('%H:%M:%S')
\ No newline at end of file
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sqlite3
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+# Writes are committed in groups rather than one WAL commit per response
+_COMMIT_EVERY = 100
+
+class ResponseCache:
+    """SQLite store of GET response bodies keyed by request, revalidated with ETags"""
+    
+    def __init__(self, cache_file: str, ttl_seconds: float):
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(__name__)
+        
+        # Every SQLite call runs on one dedicated thread, keeping disk I/O off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='response-cache')
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        self.hits = 0
+        self._pending_writes = 0
+    
+    async def _run(self, func, *args):
+        """Run a database call on the cache thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    async def open(self) -> None:
+        """Open the database and prune expired entries"""
+        await self._run(self._open)
+    
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_file)
+        # WAL with NORMAL sync keeps each insert from forcing an fsync
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT NOT NULL, link TEXT, body BLOB NOT NULL, "
+            "stored_at REAL NOT NULL)"
+        )
+        
+        # Entries not stored or revalidated within the TTL are pruned
+        self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl_seconds,))
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """Build the cache key for a GET request"""
+        if not params:
+            return url
+        return url + '?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+    
+    async def get(self, key: str) -> Optional[Tuple[str, Optional[str], bytes]]:
+        """Return (etag, link header, body) for a cached request, or None"""
+        return await self._run(self._get, key)
+    
+    def _get(self, key: str) -> Optional[Tuple[str, Optional[str], bytes]]:
+        return self._conn.execute(
+            "SELECT etag, link, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+    
+    async def put(self, key: str, etag: str, link: Optional[str], body: bytes) -> None:
+        """Store a response body with the ETag it was served with"""
+        await self._run(self._put, key, etag, link, body)
+    
+    def _put(self, key: str, etag: str, link: Optional[str], body: bytes) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, etag, link, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+            (key, etag, link, body, time.time())
+        )
+        self._wrote()
+    
+    async def touch(self, key: str) -> None:
+        """Mark a cached response as just revalidated, so the TTL counts from now"""
+        await self._run(self._touch, key)
+    
+    def _touch(self, key: str) -> None:
+        self._conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+        self._wrote()
+    
+    def _wrote(self) -> None:
+        """Commit once enough writes have accumulated"""
+        self._pending_writes += 1
+        if self._pending_writes >= _COMMIT_EVERY:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Commit pending writes"""
+        if self._pending_writes:
+            self._conn.commit()
+            self._pending_writes = 0
+    
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._flush()
+            self._conn.close()
+            self._conn = None
+    
+    async def close(self) -> None:
+        """Commit pending writes, close the database and stop the cache thread"""
+        if self.hits:
+            self.logger.info(f"Served {self.hits} responses from cache")
+        try:
+            await self._run(self._close)
+        finally:
+            self._executor.shutdown(wait=True)
@@ -14,8 +14,8 @@ def check_python_version():
     """Check if Python version is compatible"""
     print("🐍 Checking Python version...")
     
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required")
         print(f"   Current version: {sys.version}")
         return False
     
@@ -204,7 +204,7 @@ def main():
     else:
         print("⚠️  Setup validation failed. Please fix the issues above.")
         print("\n💡 Common solutions:")
-        print("   • Install Python 3.8+")
+        print("   • Install Python 3.10+")
         print("   • Run: pip install -r requirements.txt")
         print("   • Set GitHub token: export GH_TOKEN='your_token'")
     
@@ -11,7 +11,7 @@ from github_client import GitHubClient
 from checkpoint_manager import CheckpointManager
 from progress_tracker import init_progress_tracker, get_progress_tracker
 from crawlers import create_crawler
-from utils import validate_crawled_data, cleanup_empty_folders, get_folder_size_mb
+from utils import validate_crawled_data, cleanup_empty_folders, get_folder_size_mb, ensure_dir
 
 class UnifiedCrawler:
     """Main crawler orchestrator that runs all crawlers in optimal sequence"""
@@ -43,7 +43,7 @@ class UnifiedCrawler:
     def _setup_logging(self):
         """Setup logging configuration with reduced console output during display"""
         log_folder = f"{config.base_folder}/{self.repo_owner}-{self.repo_name}/logs"
-        os.makedirs(log_folder, exist_ok=True)
+        ensure_dir(log_folder)
         
         # Create timestamped log file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -91,7 +91,7 @@ class UnifiedCrawler:
             await self.progress_tracker.start_display()
             
             # Initialize GitHub client
-            async with GitHubClient() as github_client:
+            async with GitHubClient(cache_name=f"{self.repo_owner}-{self.repo_name}") as github_client:
                 self.github_client = github_client
                 
                 if self.resume:
@@ -122,7 +122,8 @@ class UnifiedCrawler:
         finally:
             self.is_running = False
             # Save final checkpoint
-            self.checkpoint_manager.save_checkpoint()
+            self.checkpoint_manager.save_checkpoint(force=True)
+            self.checkpoint_manager.close()
             
             # Stop progress display
             await self.progress_tracker.stop_display()
@@ -158,7 +159,7 @@ class UnifiedCrawler:
             )
             
             await crawler.crawl()
-            self.checkpoint_manager.save_checkpoint()
+            self.checkpoint_manager.save_checkpoint(force=True)
     
     async def _run_pr_dependencies_parallel(self) -> None:
         """Run PR dependency crawlers in parallel"""
@@ -191,7 +192,7 @@ class UnifiedCrawler:
         # Run all PR dependency crawlers in parallel
         if crawler_tasks:
             await asyncio.gather(*crawler_tasks, return_exceptions=True)
-            self.checkpoint_manager.save_checkpoint()
+            self.checkpoint_manager.save_checkpoint(force=True)
     
     async def _run_single_commits_crawler(self) -> None:
         """Run single commits crawler with intelligent batching"""
@@ -211,7 +212,7 @@ class UnifiedCrawler:
         )
         
         await crawler.crawl()
-        self.checkpoint_manager.save_checkpoint()
+        self.checkpoint_manager.save_checkpoint(force=True)
     
     async def _finalize_crawling(self):
         """Perform final validation and cleanup"""
@@ -231,7 +232,7 @@ class UnifiedCrawler:
             cleanup_empty_folders(self.base_folder_path)
             
             # Print final summary
-            folder_size = get_folder_size_mb(self.base_folder_path)
+            folder_size = validation_results['stats']['data_size_mb']
             self.logger.info(f"Crawling completed! Data size: {folder_size:.1f} MB")
             
             # Remove checkpoint file since everything is complete
@@ -1,13 +1,37 @@
 import os
-import json
 import asyncio
 import aiofiles
-from typing import List, Set, Dict, Any
+import ijson
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Set, Dict, Any, Iterable, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ijson picks its fastest installed backend; the pure Python one is several times slower
+if ijson.backend == 'python':
+    logger.warning("ijson is using its pure Python backend; install yajl for faster JSON scans")
+
+# JSON encoding options for data files (matches the previous indent=2 layout)
+_JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Items encoded per write when streaming a JSON array to disk
+_ARRAY_WRITE_CHUNK = 256
+
+# Dedicated pool for encoding large payloads off the event loop
+_json_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='json-encoder')
+
+# Folders already created by this process, so repeat calls skip the mkdir syscalls
+_created_dirs: Set[str] = set()
+
+def ensure_dir(folder_path: str):
+    """Create a folder (and parents) once per process"""
+    if folder_path not in _created_dirs:
+        os.makedirs(folder_path, exist_ok=True)
+        _created_dirs.add(folder_path)
+
 def get_all_json_files_in_folder(folder_path: str) -> List[str]:
     """Get all JSON files in a folder"""
     if not os.path.exists(folder_path):
@@ -21,25 +45,98 @@ def get_all_json_files_in_folder(folder_path: str) -> List[str]:
 async def read_json_file_async(file_path: str) -> Dict[str, Any]:
     """Asynchronously read JSON file"""
     try:
-        async with aiofiles.open(file_path, 'r') as f:
-            content = await f.read()
-            return json.loads(content)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
+        async with aiofiles.open(file_path, 'rb') as f:
+            return orjson.loads(await f.read())
+    except (orjson.JSONDecodeError, FileNotFoundError) as e:
         logger.error(f"Failed to read JSON file {file_path}: {e}")
         return {}
 
 async def write_json_file_async(file_path: str, data: Any):
-    """Asynchronously write JSON file"""
+    """Asynchronously write JSON file (bytes are written as already-encoded JSON)"""
     try:
         # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        ensure_dir(os.path.dirname(file_path))
         
-        async with aiofiles.open(file_path, 'w') as f:
-            await f.write(json.dumps(data, indent=2))
+        if isinstance(data, bytes):
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(data)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_json_executor, _write_json, file_path, data)
     except Exception as e:
         logger.error(f"Failed to write JSON file {file_path}: {e}")
         raise
 
+def write_json_file(file_path: str, data: Any):
+    """Synchronously write JSON file (bytes are written as already-encoded JSON)"""
+    ensure_dir(os.path.dirname(file_path))
+    
+    if isinstance(data, bytes):
+        with open(file_path, 'wb') as f:
+            f.write(data)
+    else:
+        _write_json(file_path, data)
+
+def _write_json(file_path: str, data: Any):
+    """Encode and write JSON, streaming non-empty lists so no whole-file buffer is built"""
+    if not isinstance(data, list) or not data:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=_JSON_WRITE_OPTIONS))
+        return
+    
+    # Same bytes as dumping the whole list: each item is re-indented one level
+    with open(file_path, 'wb') as f:
+        f.write(b'[\n  ')
+        for start in range(0, len(data), _ARRAY_WRITE_CHUNK):
+            if start:
+                f.write(b',\n  ')
+            f.write(b',\n  '.join(
+                orjson.dumps(item, option=_JSON_WRITE_OPTIONS).replace(b'\n', b'\n  ')
+                for item in data[start:start + _ARRAY_WRITE_CHUNK]
+            ))
+        f.write(b'\n]')
+
+# Read buffer for streaming large JSON files (the 8 KiB default means many more read syscalls)
+_STREAM_BUFFER_SIZE = 1 << 20
+
+def open_json_stream(file_path: str):
+    """Open a JSON file for sequential streaming reads with a large buffer"""
+    f = open(file_path, 'rb', buffering=_STREAM_BUFFER_SIZE)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Only a readahead hint
+    return f
+
+_ITEM_START_EVENTS = frozenset(('start_map', 'start_array', 'string', 'number', 'boolean', 'null'))
+
+def count_json_array_items(file_path: str) -> int:
+    """Count the items of a top-level JSON array without building them"""
+    with open_json_stream(file_path) as f:
+        # Empty lists are saved as "[]" (common for reviews and comments), so skip the parser
+        if os.fstat(f.fileno()).st_size == 2 and f.read(2) == b'[]':
+            return 0
+        f.seek(0)
+        return sum(1 for prefix, event, _ in ijson.parse(f) if prefix == 'item' and event in _ITEM_START_EVENTS)
+
+def stream_pr_states(file_path: str) -> Tuple[int, Dict[str, int]]:
+    """Count the PRs in a pull list file and tally their states without building them"""
+    total = 0
+    states: Dict[str, int] = {}
+    with open_json_stream(file_path) as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'item' and event in _ITEM_START_EVENTS:
+                total += 1
+            elif prefix == 'item.state' and event == 'string':
+                states[value] = states.get(value, 0) + 1
+    
+    # PRs with a missing or non-string state are counted as unknown
+    missing = total - sum(states.values())
+    if missing:
+        states['unknown'] = states.get('unknown', 0) + missing
+    return total, states
+
 def get_all_pull_numbers(pull_folder_path: str) -> List[int]:
     """Extract all pull request numbers from crawled data"""
     if not os.path.exists(pull_folder_path):
@@ -51,18 +148,15 @@ def get_all_pull_numbers(pull_folder_path: str) -> List[int]:
     all_data_file = f'{pull_folder_path}/all_data.json'
     if os.path.exists(all_data_file):
         try:
-            with open(all_data_file, 'r') as f:
-                data = json.load(f)
-                
-                if isinstance(data, list):
-                    for item in data:
-                        if 'number' in item:
-                            pull_numbers.add(item['number'])
-                    
-                    logger.info(f"Found {len(pull_numbers)} PR numbers from all_data.json")
-                    return sorted(list(pull_numbers))
+            # Stream only the PR numbers instead of loading every PR into memory
+            with open_json_stream(all_data_file) as f:
+                pull_numbers.update(ijson.items(f, 'item.number'))
+            
+            if pull_numbers:
+                logger.info(f"Found {len(pull_numbers)} PR numbers from all_data.json")
+                return sorted(list(pull_numbers))
                     
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        except (ijson.JSONError, FileNotFoundError) as e:
             logger.warning(f"Failed to read all_data.json: {e}")
     
     # Fallback: try individual page files
@@ -73,8 +167,8 @@ def get_all_pull_numbers(pull_folder_path: str) -> List[int]:
             continue
             
         try:
-            with open(f'{pull_folder_path}/{json_file}', 'r') as f:
-                data = json.load(f)
+            with open(f'{pull_folder_path}/{json_file}', 'rb') as f:
+                data = orjson.loads(f.read())
                 
                 # Handle both list and single PR formats
                 if isinstance(data, list):
@@ -84,7 +178,7 @@ def get_all_pull_numbers(pull_folder_path: str) -> List[int]:
                 elif isinstance(data, dict) and 'number' in data:
                     pull_numbers.add(data['number'])
                     
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        except (orjson.JSONDecodeError, FileNotFoundError, KeyError) as e:
             logger.warning(f"Failed to process file {json_file}: {e}")
     
     result = sorted(list(pull_numbers))
@@ -101,15 +195,10 @@ def get_all_commit_shas_from_commits(commit_folder_path: str) -> Set[str]:
     
     for json_file in json_files:
         try:
-            with open(f'{commit_folder_path}/{json_file}', 'r') as f:
-                data = json.load(f)
-                
-                if isinstance(data, list):
-                    for commit in data:
-                        if 'sha' in commit:
-                            commit_shas.add(commit['sha'])
+            with open_json_stream(f'{commit_folder_path}/{json_file}') as f:
+                commit_shas.update(ijson.items(f, 'item.sha'))
                             
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        except (ijson.JSONError, FileNotFoundError) as e:
             logger.warning(f"Failed to process commit file {json_file}: {e}")
     
     return commit_shas
@@ -131,15 +220,12 @@ def get_all_commit_shas_from_reviews(pull_folder_path: str) -> Set[str]:
         
         for json_file in json_files:
             try:
-                with open(f'{reviews_path}/{json_file}', 'r') as f:
-                    data = json.load(f)
-                    
-                    if isinstance(data, list):
-                        for review in data:
-                            if 'commit_id' in review and review['commit_id']:
-                                commit_shas.add(review['commit_id'])
+                with open(f'{reviews_path}/{json_file}', 'rb') as f:
+                    commit_shas.update(
+                        commit_id for commit_id in ijson.items(f, 'item.commit_id') if commit_id
+                    )
                                 
-            except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+            except (ijson.JSONError, FileNotFoundError) as e:
                 logger.warning(f"Failed to process review file {json_file}: {e}")
     
     return commit_shas
@@ -159,19 +245,101 @@ def get_all_unique_commit_shas(base_folder_path: str) -> List[str]:
                f"{len(commit_shas_from_reviews)} from reviews, "
                f"{len(all_commit_shas)} unique total")
     
-    return sorted(list(all_commit_shas))
+    return list(all_commit_shas)
+
+def get_jsonl_shards(folder_path: str) -> List[str]:
+    """Get JSONL shard file names in a folder, in write order"""
+    if not os.path.exists(folder_path):
+        return []
+    
+    return sorted(
+        file for file in os.listdir(folder_path)
+        if file.endswith('.jsonl') and not file.startswith('.')
+    )
 
 def get_existing_single_commits(single_commits_folder: str) -> Set[str]:
-    """Get set of already crawled single commit SHAs"""
+    """Get set of already crawled single commit SHAs (per-commit files and JSONL shards)"""
     if not os.path.exists(single_commits_folder):
         return set()
     
-    existing_files = [
-        f.replace('.json', '') for f in os.listdir(single_commits_folder)
-        if f.endswith('.json') and not f.startswith('.')
-    ]
+    with os.scandir(single_commits_folder) as it:
+        existing = {
+            e.name[:-5] for e in it
+            if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file(follow_symlinks=False)
+        }
     
-    return set(existing_files)
+    for shard in get_jsonl_shards(single_commits_folder):
+        try:
+            with open_json_stream(f'{single_commits_folder}/{shard}') as f:
+                existing.update(ijson.items(f, 'sha', multiple_values=True))
+        except ijson.JSONError as e:
+            # A torn last line from an interrupted run; keep what parsed
+            logger.warning(f"Stopped reading shard {shard} at invalid data: {e}")
+    
+    return existing
+
+def count_existing_single_commits(single_commits_folder: str) -> int:
+    """Count crawled single commits without building their SHA set"""
+    if not os.path.exists(single_commits_folder):
+        return 0
+    
+    count = 0
+    shards = []
+    with os.scandir(single_commits_folder) as it:
+        for e in it:
+            name = e.name
+            if name.startswith('.'):
+                continue
+            if name.endswith('.json'):
+                count += 1
+            elif name.endswith('.jsonl'):
+                shards.append(e.path)
+    
+    # Every complete shard line is one commit; a torn last line has no newline
+    for shard_path in shards:
+        with open_json_stream(shard_path) as f:
+            count += sum(1 for line in f if line.endswith(b'\n'))
+    
+    return count
+
+class JsonlShardWriter:
+    """Appends JSON documents as lines to rolling .jsonl shard files"""
+    
+    def __init__(self, folder_path: str, prefix: str, shard_size: int):
+        self.folder_path = folder_path
+        self.prefix = prefix
+        self.shard_size = shard_size
+        
+        # Always start a fresh shard so an interrupted run's last line is never appended to
+        existing = get_jsonl_shards(folder_path)
+        self._index = len(existing)
+        self._lines = 0
+        self._file = None
+    
+    def append(self, documents: List[Any]):
+        """Encode and append documents, rotating shards as they fill up"""
+        for document in documents:
+            if self._file is None or self._lines >= self.shard_size:
+                self._open_next_shard()
+            self._file.write(orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS) + b'\n')
+            self._lines += 1
+        
+        if self._file is not None:
+            self._file.flush()
+    
+    def _open_next_shard(self):
+        """Close the current shard and start the next one"""
+        self.close()
+        ensure_dir(self.folder_path)
+        self._file = open(f"{self.folder_path}/{self.prefix}-{self._index:05d}.jsonl", 'ab')
+        self._index += 1
+        self._lines = 0
+    
+    def close(self):
+        """Close the current shard"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 def calculate_remaining_work(base_folder_path: str) -> Dict[str, int]:
     """Calculate how much work remains for each crawler"""
@@ -207,7 +375,7 @@ def ensure_folder_structure(base_folder_path: str):
     ]
     
     for folder in folders:
-        os.makedirs(folder, exist_ok=True)
+        ensure_dir(folder)
 
 async def batch_process_async(items: List[Any], batch_size: int, 
                             process_func, *args, **kwargs) -> List[Any]:
@@ -225,21 +393,45 @@ async def batch_process_async(items: List[Any], batch_size: int,
     
     return results
 
-def get_folder_size_mb(folder_path: str) -> float:
-    """Get total size of folder in MB"""
-    if not os.path.exists(folder_path):
-        return 0.0
+async def gather_bounded(process_func, items: Iterable[Any], limit: int,
+                         return_exceptions: bool = False) -> List[Any]:
+    """Run process_func over items with at most limit in flight, results in item order"""
+    semaphore = asyncio.Semaphore(limit)
     
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(folder_path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            try:
-                total_size += os.path.getsize(file_path)
-            except OSError:
-                pass
+    async def run(item):
+        async with semaphore:
+            return await process_func(item)
     
-    return total_size / (1024 * 1024)  # Convert to MB
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=return_exceptions)
+
+def scan_tree(root: str) -> Tuple[int, Dict[str, int]]:
+    """Walk a folder once, returning total bytes and file counts per top-level subfolder"""
+    total_bytes = 0
+    file_counts: Dict[str, int] = {}
+    stack = [(root, '')]
+    
+    while stack:
+        path, category = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, category or entry.name))
+                        else:
+                            total_bytes += entry.stat(follow_symlinks=False).st_size
+                            file_counts[category] = file_counts.get(category, 0) + 1
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    
+    return total_bytes, file_counts
+
+def get_folder_size_mb(folder_path: str) -> float:
+    """Get total size of folder in MB"""
+    total_bytes, _ = scan_tree(folder_path)
+    return total_bytes / (1024 * 1024)  # Convert to MB
 
 def cleanup_empty_folders(base_path: str):
     """Remove empty folders recursively"""
@@ -249,6 +441,7 @@ def cleanup_empty_folders(base_path: str):
             try:
                 if not os.listdir(dir_path):  # Empty directory
                     os.rmdir(dir_path)
+                    _created_dirs.discard(dir_path)
                     logger.debug(f"Removed empty folder: {dir_path}")
             except OSError:
                 pass
@@ -265,6 +458,11 @@ def validate_crawled_data(base_folder_path: str) -> Dict[str, Any]:
     }
     
     try:
+        # One pass over the tree for size and per-folder file counts
+        total_bytes, file_counts = scan_tree(base_folder_path)
+        validation_results['stats']['data_size_mb'] = total_bytes / (1024 * 1024)
+        validation_results['stats']['file_counts'] = file_counts
+        
         # Analyze pull requests DATA (not just files)
         pull_analysis = _analyze_pull_requests_data(base_folder_path)
         validation_results['stats'].update(pull_analysis['stats'])
@@ -326,20 +524,14 @@ def _analyze_pull_requests_data(base_folder_path: str) -> Dict[str, Any]:
     # Check main pull requests file
     if os.path.exists(all_data_file):
         try:
-            with open(all_data_file, 'r') as f:
-                pull_data = json.load(f)
-                
-            analysis['stats']['total_pull_requests'] = len(pull_data)
-            analysis['details']['has_main_data'] = True
+            # Stream the PR array so only one item's fields are held at a time
+            total, states = stream_pr_states(all_data_file)
             
-            # Analyze PR states
-            states = {}
-            for pr in pull_data:
-                state = pr.get('state', 'unknown')
-                states[state] = states.get(state, 0) + 1
+            analysis['stats']['total_pull_requests'] = total
+            analysis['details']['has_main_data'] = True
             analysis['details']['pr_states'] = states
             
-        except json.JSONDecodeError as e:
+        except ijson.JSONError as e:
             analysis['errors'].append(f"Invalid JSON in pull requests file: {e}")
             analysis['stats']['total_pull_requests'] = 0
             analysis['details']['has_main_data'] = False
@@ -377,13 +569,10 @@ def _analyze_commits_data(base_folder_path: str) -> Dict[str, Any]:
     # Check main commits file
     if os.path.exists(all_data_file):
         try:
-            with open(all_data_file, 'r') as f:
-                commit_data = json.load(f)
-                
-            analysis['stats']['total_repository_commits'] = len(commit_data)
+            analysis['stats']['total_repository_commits'] = count_json_array_items(all_data_file)
             analysis['details']['has_main_commits'] = True
             
-        except json.JSONDecodeError as e:
+        except ijson.JSONError as e:
             analysis['errors'].append(f"Invalid JSON in commits file: {e}")
             analysis['stats']['total_repository_commits'] = 0
             analysis['details']['has_main_commits'] = False
@@ -399,13 +588,13 @@ def _analyze_commits_data(base_folder_path: str) -> Dict[str, Any]:
     # Check individual commit details
     single_commits_folder = f"{commit_folder}/all"
     if os.path.exists(single_commits_folder):
-        commit_files = [f for f in os.listdir(single_commits_folder) if f.endswith('.json')]
-        analysis['stats']['individual_commit_details'] = len(commit_files)
-        analysis['details']['has_individual_commits'] = len(commit_files) > 0
+        single_commit_count = count_existing_single_commits(single_commits_folder)
+        analysis['stats']['individual_commit_details'] = single_commit_count
+        analysis['details']['has_individual_commits'] = single_commit_count > 0
         
         # Calculate coverage percentage
         if analysis['stats']['total_repository_commits'] > 0:
-            coverage = (len(commit_files) / analysis['stats']['total_repository_commits']) * 100
+            coverage = (single_commit_count / analysis['stats']['total_repository_commits']) * 100
             analysis['stats']['commit_detail_coverage_percentage'] = round(coverage, 1)
         else:
             analysis['stats']['commit_detail_coverage_percentage'] = 0
@@ -450,8 +639,8 @@ def _analyze_pr_dependencies_data(base_folder_path: str) -> Dict[str, Any]:
             
             if os.path.exists(dep_file):
                 try:
-                    with open(dep_file, 'r') as f:
-                        data = json.load(f)
+                    with open(dep_file, 'rb') as f:
+                        data = orjson.loads(f.read())
                     
                     if len(data) > 0:
                         stats[f'prs_with_{dep_type}'] += 1
@@ -459,7 +648,7 @@ def _analyze_pr_dependencies_data(base_folder_path: str) -> Dict[str, Any]:
                     else:
                         stats[f'prs_without_{dep_type}'] += 1
                         
-                except (json.JSONDecodeError, Exception):
+                except (orjson.JSONDecodeError, Exception):
                     stats[f'prs_without_{dep_type}'] += 1
             else:
                 stats[f'prs_without_{dep_type}'] += 1
@@ -498,10 +687,12 @@ def _validate_json_integrity(base_folder_path: str) -> Dict[str, Any]:
     for file_path in key_files:
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    json.load(f)
+                # Parse as a stream so large arrays are never held in memory
+                with open_json_stream(file_path) as f:
+                    for _ in ijson.parse(f):
+                        pass
                 validation['files_checked'] += 1
-            except json.JSONDecodeError as e:
+            except ijson.JSONError as e:
                 validation['errors'].append(f"Invalid JSON in {file_path}: {e}")
     
     # Check sample of individual files
@@ -513,11 +704,25 @@ def _validate_json_integrity(base_folder_path: str) -> Dict[str, Any]:
         for commit_file in commit_files[:sample_size]:
             file_path = f"{individual_commit_folder}/{commit_file}"
             try:
-                with open(file_path, 'r') as f:
-                    json.load(f)
+                with open(file_path, 'rb') as f:
+                    orjson.loads(f.read())
                 validation['files_checked'] += 1
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 validation['errors'].append(f"Invalid JSON in {file_path}: {e}")
+        
+        # Check a sample of lines from the first JSONL shard
+        shards = get_jsonl_shards(individual_commit_folder)
+        if shards:
+            file_path = f"{individual_commit_folder}/{shards[0]}"
+            with open(file_path, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if line_number > 10:
+                        break
+                    try:
+                        orjson.loads(line)
+                        validation['files_checked'] += 1
+                    except orjson.JSONDecodeError as e:
+                        validation['errors'].append(f"Invalid JSON in {file_path} line {line_number}: {e}")
     
     return validation
 